@@ -2,8 +2,11 @@
 
 import logging
 import os
+from collections.abc import Iterator
 from contextlib import contextmanager
 from pathlib import Path
+from queue import Empty
+from queue import SimpleQueue
 
 from duckdb import DuckDBPyConnection
 from monzo_py import MonzoTransactions
@@ -61,6 +64,17 @@ class Monzo(App):
     monzo_transactions: reactive[MonzoTransactions | None] = reactive(None)
     db_connection: reactive[DuckDBPyConnection | None] = reactive(None)
 
+    # Set while settings are saved together, so watchers leave reloading to
+    # save_settings rather than each starting their own fetch
+    _suppress_fetch: bool = False
+
+    # db_connection paired with its idle cursors, replaced together so that
+    # get_db_connection never mixes a connection with another one's pool
+    _cursor_pool: tuple[DuckDBPyConnection | None, SimpleQueue[DuckDBPyConnection]] = (
+        None,
+        SimpleQueue(),
+    )
+
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
         yield Header()
@@ -74,6 +88,8 @@ class Monzo(App):
     def watch_spreadsheet_id(self, new_spreadsheet_id: str) -> None:
         """Watch for changes to spreadsheet_id and reinitialize MonzoTransactions."""
         logger.info(f"Spreadsheet ID changed to: {new_spreadsheet_id}")
+        if self._suppress_fetch:
+            return
         if new_spreadsheet_id and self.credentials_path.exists():
             self.get_transactions()
 
@@ -85,6 +101,8 @@ class Monzo(App):
     def watch_credentials_path(self, new_credentials_path: Path) -> None:
         """Watch for changes to credentials_path and reinitialize MonzoTransactions."""
         logger.info(f"Credentials path changed to: {new_credentials_path}")
+        if self._suppress_fetch:
+            return
         if self.spreadsheet_id and new_credentials_path.exists():
             self.get_transactions()
 
@@ -93,6 +111,28 @@ class Monzo(App):
         dashboard = self.get_screen("dashboard")
         widget = dashboard.query_one(PayDayView)
         widget.pay_day = new_pay_day
+        if self.monzo_transactions and not self._suppress_fetch:
+            self.reload_db_connection()
+
+    def watch_db_connection(self, db_conn: DuckDBPyConnection | None) -> None:
+        """Start a fresh cursor pool for a new connection.
+
+        The old connection is not closed here so that queries still running on
+        its cursors can finish; it is released along with its last cursor.
+        """
+        self._cursor_pool = (db_conn, SimpleQueue())
+
+    def open_db_connection(self, transactions: MonzoTransactions) -> DuckDBPyConnection:
+        """Open a connection on the transactions with pay day columns added."""
+        db_conn = transactions.duck_db()
+        self.add_pay_day_information(db_conn)
+        return db_conn
+
+    @work(exclusive=True, thread=True, group="db")
+    def reload_db_connection(self) -> None:
+        """Rebuild the shared connection from the already fetched transactions."""
+        db_conn = self.open_db_connection(self.monzo_transactions)
+        self.call_from_thread(setattr, self, "db_connection", db_conn)
 
     @work(exclusive=True, thread=True)
     def get_transactions(self) -> None:
@@ -108,10 +148,12 @@ class Monzo(App):
             if not worker.is_cancelled:
                 # This runs in the background thread - good for slow operations
                 transactions.fetch_data()
+                db_conn = self.open_db_connection(transactions)
                 self.notify("Monzo data updated.", title="Refresh Complete", timeout=3)
 
-                # Safely update the reactive attribute from the background thread
+                # Safely update the reactive attributes from the background thread
                 self.call_from_thread(setattr, self, "monzo_transactions", transactions)
+                self.call_from_thread(setattr, self, "db_connection", db_conn)
 
                 # Notify dashboard screen directly that data is available
                 logger.info(
@@ -182,10 +224,26 @@ class Monzo(App):
                 logger.info("Saving settings...")
                 valid = self.check_settings(spreadsheet_id, credentials_path)
                 if valid:
-                    self.spreadsheet_id = spreadsheet_id
-                    self.credentials_path = credentials_path
-                    self.pay_day_type = pay_day_type
-                    self.pay_day = pay_day
+                    source_changed = (spreadsheet_id, credentials_path) != (
+                        self.spreadsheet_id,
+                        self.credentials_path,
+                    )
+                    pay_day_changed = pay_day != self.pay_day
+
+                    self._suppress_fetch = True
+                    try:
+                        self.spreadsheet_id = spreadsheet_id
+                        self.credentials_path = credentials_path
+                        self.pay_day_type = pay_day_type
+                        self.pay_day = pay_day
+                    finally:
+                        self._suppress_fetch = False
+
+                    # One reload covering every setting that changed
+                    if source_changed:
+                        self.get_transactions()
+                    elif pay_day_changed and self.monzo_transactions:
+                        self.reload_db_connection()
                     self.notify(
                         f"Spreadsheet ID: {spreadsheet_id}\nCredentials Path: {credentials_path}\nPay Day Type: {pay_day_type}\nPay Day: {pay_day}",
                         title="Settings Updated",
@@ -209,19 +267,28 @@ class Monzo(App):
         self.get_transactions()
 
     @contextmanager
-    def get_db_connection(self):
-        """Get the DuckDB connection for views to query data."""
-        if not self.monzo_transactions:
+    def get_db_connection(self) -> Iterator[DuckDBPyConnection | None]:
+        """Lend views a cursor on the shared DuckDB connection.
+
+        Cursors are reused through a pool so that concurrent workers each get
+        their own handle without creating a new one for every query.
+        """
+        # Read once: the cursor goes back to the pool it came from, and both
+        # belong to the same connection even if it is replaced meanwhile
+        db_conn, pool = self._cursor_pool
+        if db_conn is None:
             logger.error("MonzoTransactions not initialized.")
             yield None
             return
 
-        db_conn = self.monzo_transactions.duck_db()
         try:
-            self.add_pay_day_information(db_conn)
-            yield db_conn
+            cursor = pool.get_nowait()
+        except Empty:
+            cursor = db_conn.cursor()
+        try:
+            yield cursor
         finally:
-            db_conn.close()
+            pool.put(cursor)
 
     def add_pay_days_table(self, db_conn: DuckDBPyConnection) -> None:
         sql_query: str = """
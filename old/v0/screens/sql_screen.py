@@ -7,6 +7,7 @@ from textual.app import ComposeResult
 from textual.containers import Container
 from textual.reactive import reactive
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Button
 from textual.widgets import Footer
 from textual.widgets import Header
@@ -27,6 +28,14 @@ class SQLScreen(Screen):
 
     sql_query = reactive("")
 
+    # Seconds of typing inactivity before the editor text becomes sql_query
+    SQL_QUERY_DELAY = 0.15
+    _sql_timer: Timer | None = None
+
+    # Most recent query results, oldest first, keyed by SQL text
+    RESULT_CACHE_SIZE = 16
+    _result_cache: dict[str, tuple[list[str], list[tuple]]] = {}
+
     def compose(self) -> ComposeResult:
         container = Container(self.code_editor(), self.table_view(), self.chart_view())
         container.border_title = "Custom SQL"
@@ -36,7 +45,10 @@ class SQLScreen(Screen):
         yield container
 
     def on_mount(self) -> None:
-        self.on_text_area_changed(TextArea.Changed(TextArea()))
+        self._result_cache = {}
+        # Cached results belong to the connection they were queried on
+        self.watch(self.app, "db_connection", self._result_cache.clear, init=False)
+        self._sync_sql_query()
 
     def code_editor(self) -> CodeEditorView:
         return CodeEditorView()
@@ -48,19 +60,53 @@ class SQLScreen(Screen):
         return CustomSQLTableView()
 
     def on_text_area_changed(self, event: TextArea.Changed) -> None:
+        if self._sql_timer is not None:
+            self._sql_timer.stop()
+        self._sql_timer = self.set_timer(self.SQL_QUERY_DELAY, self._sync_sql_query)
+
+    def _sync_sql_query(self) -> None:
+        if self._sql_timer is not None:
+            self._sql_timer.stop()
+            self._sql_timer = None
         self.sql_query = self.query_one(TextArea).text
 
     def update_all(self):
-        try:
-            self.query_one(CustomSQLTableView).update(self.sql_query)
-        except Exception as e:
-            logger.error(f"Error updating table view: {e}")
-            self.app.notify(f"Error updating table view: {e}", severity="error")
-        try:
-            self.query_one(CustomSQLChartView).update(self.sql_query)
-        except Exception as e:
-            logger.error(f"Error updating chart view: {e}")
-            self.app.notify(f"Error updating chart view: {e}", severity="error")
+        # Pick up any edits still waiting on the debounce timer
+        if self._sql_timer is not None:
+            self._sync_sql_query()
+        self._run_update(self.sql_query)
+
+    @work(exclusive=True, thread=True)
+    def _run_update(self, query: str) -> None:
+        """Run the query off the UI thread and show the result in both views."""
+        worker = get_current_worker()
+        table_view = self.query_one(CustomSQLTableView)
+        chart_view = self.query_one(CustomSQLChartView)
+        cached = self._result_cache.pop(query, None)
+        if cached is not None:
+            column_names, data = cached
+        else:
+            try:
+                column_names, data = table_view.fetch_query(query)
+            except Exception as e:
+                logger.error(f"Error running query: {e}")
+                self.app.notify(f"Error running query: {e}", severity="error")
+                return
+
+        # No columns means there was no connection to query, so nothing to keep
+        if column_names:
+            self._result_cache[query] = column_names, data
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                del self._result_cache[next(iter(self._result_cache))]
+
+        if worker.is_cancelled:
+            return
+        for name, view in (("table", table_view), ("chart", chart_view)):
+            try:
+                self.app.call_from_thread(view.show, column_names, data)
+            except Exception as e:
+                logger.error(f"Error updating {name} view: {e}")
+                self.app.notify(f"Error updating {name} view: {e}", severity="error")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "run-query":
@@ -69,10 +115,8 @@ class SQLScreen(Screen):
     def action_run_query(self):
         self.update_all()
 
-    @work(exclusive=True, thread=True)
     def on_monzo_monzo_transactions_initialized(self, message) -> None:
         """Handle MonzoTransactionsInitialized message."""
-        worker = get_current_worker()
-        if not worker.is_cancelled:
-            logger.info("Refreshing custom data.")
-            self.update_all()
+        logger.info("Refreshing custom data.")
+        self._result_cache.clear()
+        self.update_all()
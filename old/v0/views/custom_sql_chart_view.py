@@ -21,8 +21,12 @@ class CustomSQLChartView(PlotextPlot, DataView):
         self.refresh()
 
     def update(self, query: str) -> None:
+        self.show(*self.fetch_query(query))
+
+    def show(self, column_names: list[str], data: list[tuple]) -> None:
+        """Plot rows already fetched for a query."""
         self.plt.clear_data()
         self.refresh()
-        self._column_names = self.get_column_names_from_query(query)
-        self.data = self.run_query(query)
+        self._column_names = column_names
+        self.data = data
         self.replot()
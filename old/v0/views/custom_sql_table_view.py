@@ -16,10 +16,11 @@ class CustomSQLTableView(DataTable, DataView):
         self.cursor_type = "row"
 
     def update(self, query: str) -> None:
-        self.clear(columns=True)
-        self._column_names = self.get_column_names_from_query(query)
-        columns = self.pretty_columns()
-        data = self.run_query(query)
+        self.show(*self.fetch_query(query))
 
-        self.add_columns(*columns)
+    def show(self, column_names: list[str], data: list[tuple]) -> None:
+        """Display rows already fetched for a query."""
+        self.clear(columns=True)
+        self._column_names = column_names
+        self.add_columns(*self.pretty_columns())
         self.add_rows(data)
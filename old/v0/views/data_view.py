@@ -52,6 +52,16 @@ class DataView:
             # Query transactions data
             return db_connection.sql(query).fetchall()
 
+    def fetch_query(self, query: str) -> tuple[list[str], list[tuple]]:
+        """Run a SQL query and return its column names and rows."""
+        with self.db_connection() as db_connection:
+            if not db_connection:
+                logger.info("No database connection available")
+                return [], []
+
+            relation = db_connection.sql(query)
+            return relation.columns, relation.fetchall()
+
     def load_data(self) -> None:
         """Load transaction data from the app's DuckDB connection."""
         # Get database connection from app using context manager
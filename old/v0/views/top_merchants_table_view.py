@@ -11,11 +11,16 @@ class TopMerchantsTableView(DataTable, DataView):
     """A placeholder widget for the category table."""
 
     sql_query = """
-    select name, min(category) as category, sum(amount * -1) as amount, count(amount) as txns
-    from transactions
-    where expenseMonthDate = (select max(expenseMonthDate) from transactions)
+    with latest as (select max(expenseMonthDate) as month from transactions)
+    select
+        name,
+        min(category) as category,
+        printf('£ %,.2f', sum(amount * -1)) as amount,
+        count(amount)::varchar as txns
+    from transactions, latest
+    where expenseMonthDate = latest.month
     group by name
-    order by amount desc
+    order by sum(amount * -1) desc
     """
 
     def on_mount(self) -> None:
@@ -23,8 +28,8 @@ class TopMerchantsTableView(DataTable, DataView):
         self.cursor_type = "row"
         self.zebra_stripes = True
 
-    def watch_data(self, data: list[tuple[str, str]]) -> None:
+    def watch_data(self, data: list[tuple[str, str, str, str]]) -> None:
         self.clear(columns=True)
         self.add_columns(*self.pretty_columns())
-        for row in data:
-            self.add_row(row[0], row[1], f"£ {row[2]:,.2f}", str(row[3]))
+        # Rows arrive display-ready from the query
+        self.add_rows(data)
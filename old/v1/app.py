@@ -1,17 +1,20 @@
 """Main app file."""
 
+from __future__ import annotations
+
 import logging
+from functools import cache
+from importlib.resources import files
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Literal
 
-from duckdb import DuckDBPyConnection
-from monzo_py import MonzoTransactions
 from textual import work
 from textual.app import App
 from textual.app import ComposeResult
 from textual.logging import TextualHandler
 from textual.message import Message
-from textual.reactive import reactive
+from textual.screen import Screen
 from textual.widgets import Footer
 from textual.widgets import Header
 
@@ -20,10 +23,38 @@ from .screens import DetailModalScreen
 from .screens import ExclusionsModalScreen
 from .screens import SettingsModalScreen
 
+# DuckDB and monzo_py are slow to import, so load them on the first fetch
+if TYPE_CHECKING:
+    from duckdb import DuckDBPyConnection
+    from monzo_py import MonzoTransactions
+
 logging.basicConfig(level=logging.DEBUG, handlers=[TextualHandler()])
 
 logger = logging.getLogger(__name__)
 
+# Every script in sql_scripts, read once at import and keyed by file name
+_SQL_SCRIPTS: dict[str, str] = {
+    script.name: script.read_text(encoding="utf-8")
+    for script in (files(__package__) / "sql_scripts").iterdir()
+    if script.name.endswith(".sql")
+}
+
+
+# Scripts run on a fresh connection, and the subset that re-derives the pay
+# day columns from the raw transactions already set aside on that connection
+_LOAD_SCRIPTS = (
+    "rename_raw_transactions.sql",
+    "add_pay_days_table.sql",
+    "add_pay_days_to_transactions.sql",
+)
+_PAY_DAY_SCRIPTS = _LOAD_SCRIPTS[1:]
+
+
+@cache
+def _load_sql_batch(*names: str) -> str:
+    """Scripts joined into one batch for a single execute()."""
+    return ";\n\n".join(_SQL_SCRIPTS[name].strip().rstrip(";") for name in names)
+
 
 class Monzo(App):
     """Main app class."""
@@ -43,8 +74,18 @@ class Monzo(App):
         "detail": DetailModalScreen,
     }
 
-    transactions: reactive[MonzoTransactions | None] = reactive(None)
-    db: reactive[DuckDBPyConnection | None] = reactive(None)
+    # Nothing renders these directly; fetches announce new data with a message
+    transactions: MonzoTransactions | None = None
+    db: DuckDBPyConnection | None = None
+
+    # Screens that were covered when transactions last became available
+    _stale_screens: set[Screen] = set()
+
+    # Widget query results for the current data, keyed by data_version, SQL
+    # and parameters; data_version is bumped whenever db's contents change
+    QUERY_CACHE_SIZE = 64
+    data_version: int = 0
+    query_cache: dict[tuple, tuple[list[str], list[tuple]]] = {}
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -52,6 +93,8 @@ class Monzo(App):
 
     ## DEFAULT METHODS
     def on_mount(self) -> None:
+        self._stale_screens = set()
+        self.query_cache = {}
         self.theme = "nord"
         self.push_screen("dashboard")
         self.fetch_monzo_transactions()
@@ -67,11 +110,24 @@ class Monzo(App):
         self.exit()
 
     def action_open_settings(self):
+        source = (
+            self.get_setting("spreadsheet_id"),
+            self.get_setting("credentials_path"),
+        )
+
         def save_settings(to_update: bool) -> None:
             if to_update:
                 pay_day = self.get_setting("pay_day")
                 self.get_screen("dashboard").pay_day = pay_day
-                self.fetch_monzo_transactions()
+                new_source = (
+                    self.get_setting("spreadsheet_id"),
+                    self.get_setting("credentials_path"),
+                )
+                # Only the sheet settings need the transactions fetched again
+                if self.db is not None and new_source == source:
+                    self.recalculate_pay_days()
+                else:
+                    self.fetch_monzo_transactions()
 
         self.push_screen("settings", save_settings)
 
@@ -81,6 +137,8 @@ class Monzo(App):
     ## MONZO METHODS
     @work(exclusive=True, thread=True)
     def fetch_monzo_transactions(self) -> None:
+        from monzo_py import MonzoTransactions
+
         logger.info("Fetching monzo data.")
         spreadsheet_id: str = self.get_setting("spreadsheet_id")
         credentials_path: Path = self.get_setting("credentials_path")
@@ -99,12 +157,14 @@ class Monzo(App):
                 credentials_path=credentials_path,
             )
             db = self.transactions.duck_db()
-            self.add_pay_days_table(db, pay_day)
-            self.add_pay_days_to_transactions(db)
+            self.add_pay_days(db, pay_day)
             self.db = db
+            self.invalidate_queries()
         except Exception as e:
             self.notify(f"Error fetching Monzo transactions: {e}", severity="error")
             return
+        logger.info("Transactions updated.")
+        self.call_from_thread(self.post_transactions_available)
 
     def get_setting(
         self, setting_name: Literal["spreadsheet_id", "credentials_path", "pay_day"]
@@ -116,29 +176,48 @@ class Monzo(App):
         logger.info("Refreshing data")
         self.fetch_monzo_transactions()
 
-    def add_pay_days_table(self, db: DuckDBPyConnection, pay_day: int) -> None:
-        app = Path(__file__).parent
-        sql = app / "sql_scripts"
-        with open(sql / "add_pay_days_table.sql") as f:
-            sql = f.read()
-        db.sql(sql, params=[pay_day])
-
-    def add_pay_days_to_transactions(self, db: DuckDBPyConnection) -> None:
-        app = Path(__file__).parent
-        sql = app / "sql_scripts"
-        with open(sql / "add_pay_days_to_transactions.sql") as f:
-            sql = f.read()
-        db.sql(sql)
-
-    def watch_db(self, transactions: MonzoTransactions | None) -> None:
-        logger.info("Transactions updated.")
-        if transactions:
-            self.post_transactions_available()
+    @work(exclusive=True, thread=True, group="pay_days")
+    def recalculate_pay_days(self) -> None:
+        logger.info("Recalculating pay days.")
+        try:
+            self.add_pay_days(self.db, self.get_setting("pay_day"), _PAY_DAY_SCRIPTS)
+            self.invalidate_queries()
+        except Exception as e:
+            self.notify(f"Error recalculating pay days: {e}", severity="error")
+            return
+        self.call_from_thread(self.post_transactions_available)
+
+    def invalidate_queries(self) -> None:
+        """Drop cached widget query results after db's contents change."""
+        self.data_version += 1
+        self.query_cache.clear()
+
+    def add_pay_days(
+        self,
+        db: DuckDBPyConnection,
+        pay_day: int,
+        scripts: tuple[str, ...] = _LOAD_SCRIPTS,
+    ) -> None:
+        # Prepared parameters only bind to the last statement of a batch, so
+        # pass pay_day as a variable; int() keeps the literal safe to inline
+        db.execute(
+            f"SET VARIABLE pay_day = {int(pay_day)};\n{_load_sql_batch(*scripts)}"
+        )
 
     def post_transactions_available(self) -> None:
-        for screen in self.screen_stack:
-            logger.debug(f"Posting TransactionsAvailable message to {screen}.")
-            screen.post_message(self.TransactionsAvailable())
+        *covered, active = self.screen_stack
+        # Covered screens catch up through claim_transactions_available on resume
+        self._stale_screens.update(covered)
+        self._stale_screens.discard(active)
+        logger.debug(f"Posting TransactionsAvailable message to {active}.")
+        active.post_message(self.TransactionsAvailable())
+
+    def claim_transactions_available(self, screen: Screen) -> bool:
+        """Return whether screen missed a TransactionsAvailable while covered."""
+        if screen in self._stale_screens:
+            self._stale_screens.discard(screen)
+            return True
+        return False
 
 
 app = Monzo()
@@ -9,6 +9,7 @@ from textual.containers import Container
 from textual.message import Message
 from textual.reactive import reactive
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import DataTable
 from textual.widgets import Footer
 from textual.widgets import Header
@@ -36,6 +37,14 @@ class DashboardScreen(Screen):
     pay_day = reactive(int(os.getenv("MONZO_PAY_DAY", "31")))
     exclusions = reactive([])
 
+    # Seconds to let a burst of refresh triggers settle before querying
+    UPDATE_DELAY = 0.05
+    _refresh_timer: Timer | None = None
+    _full_update_pending: bool = False
+
+    # Widgets from compose, looked up once on mount
+    _calendar: PayDayCalendar | None = None
+
     def compose(self) -> ComposeResult:
         container = Container(
             Logo(),
@@ -54,21 +63,52 @@ class DashboardScreen(Screen):
         yield Footer()
         yield Header()
 
+    def on_mount(self) -> None:
+        self._balance = self.query_one(BalanceCard)
+        self._latest = self.query_one(LatestTransactionsTable)
+        self._top_merchants = self.query_one(TopMerchantsTable)
+        self._top_categories = self.query_one(TopCategoriesTable)
+        self._monthly_spend = self.query_one(MonthlySpendChart)
+        self._spending_comparison = self.query_one(SpendingComparisonChart)
+        self._calendar = self.query_one(PayDayCalendar)
+        self._calendar.pay_day = self.pay_day
+
     def update_all(self) -> None:
-        self.query_one(BalanceCard).update()
-        self.query_one(LatestTransactionsTable).update()
-        self.query_one(TopMerchantsTable).update()
-        self.query_one(TopCategoriesTable).update()
-        self.query_one(MonthlySpendChart).update(exclusions=self.exclusions)
-        self.query_one(SpendingComparisonChart).update()
+        self._balance.update()
+        self._latest.update()
+        self._top_merchants.update()
+        self._top_categories.update()
+        self.update_exclusions()
+
+    def update_exclusions(self) -> None:
+        self._monthly_spend.update(exclusions=self.exclusions)
+        self._spending_comparison.update(exclusions=self.exclusions)
+
+    def _schedule_update(self, *, full: bool) -> None:
+        """Coalesce update requests into one pass after UPDATE_DELAY."""
+        self._full_update_pending |= full
+        if self._refresh_timer is None:
+            self._refresh_timer = self.set_timer(self.UPDATE_DELAY, self._flush_update)
+
+    def _flush_update(self) -> None:
+        self._refresh_timer = None
+        if self._full_update_pending:
+            self._full_update_pending = False
+            self.update_all()
+        else:
+            self.update_exclusions()
 
     def on_monzo_transactions_available(self, message: Message) -> None:
         self.app.notify(f"{self.__class__.__name__}: {message}", severity="information")
-        self.update_all()
+        self._schedule_update(full=True)
+
+    def on_screen_resume(self) -> None:
+        # Catch up on transactions that arrived while a modal covered the screen
+        if self.app.claim_transactions_available(self):
+            self.post_message(self.app.TransactionsAvailable())
 
     def watch_exclusions(self, exclusions: list[str]) -> None:
-        self.query_one(MonthlySpendChart).update(exclusions=exclusions)
-        self.query_one(SpendingComparisonChart).update(exclusions=exclusions)
+        self._schedule_update(full=False)
 
     def get_exclusions(self) -> None:
         screen = self.app.get_screen("exclusions")
@@ -77,10 +117,9 @@ class DashboardScreen(Screen):
             self.exclusions = selection_lists.first().selected
 
     def watch_pay_day(self, pay_day: int) -> None:
-        try:
-            self.query_one(PayDayCalendar).pay_day = pay_day
-        except Exception:
-            logger.debug("Pay day set before mounting")
+        # Before mount, on_mount hands the calendar the latest pay day instead
+        if self._calendar is not None:
+            self._calendar.pay_day = pay_day
 
     def update_detailed(
         self, table: DataWidget, row: DataTable.RowSelected, column: str
@@ -95,10 +134,10 @@ class DashboardScreen(Screen):
 
     @on(DataTable.RowSelected, "#top-categories-table")
     def top_category_selected(self, row: DataTable.RowSelected) -> None:
-        table = self.query_one(TopCategoriesTable)
+        table = self._top_categories
         self.update_detailed(table, row, "category")
 
     @on(DataTable.RowSelected, "#top-merchants-table")
     def top_merchant_selected(self, row: DataTable.RowSelected) -> None:
-        table = self.query_one(TopMerchantsTable)
+        table = self._top_merchants
         self.update_detailed(table, row, "name")
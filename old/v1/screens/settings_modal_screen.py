@@ -2,6 +2,7 @@
 
 import logging
 import os
+from functools import cache
 from pathlib import Path
 
 from textual import on
@@ -20,6 +21,21 @@ __all__ = ["SettingsErrorScreen", "SettingsModalScreen"]
 
 logger = logging.getLogger(__name__)
 
+_PAY_DAY_TYPE_OPTIONS = (
+    ("First day of the month", "first"),
+    ("Last day of the month", "last"),
+    ("Specific day of the month", "specific"),
+)
+
+# Focused widgets that handle Enter themselves rather than saving the form
+_SKIP_ENTER = (OptionList, Select)
+
+
+@cache
+def _expand_path(path: str) -> Path:
+    """Expanded credentials path, parsed once per distinct input value."""
+    return Path(path).expanduser()
+
 
 class SpreadsheetIdInput(Input):
     """Input field for the spreadsheet ID."""
@@ -76,16 +92,11 @@ class SettingsModalScreen(ModalScreen[bool]):
     pay_day: reactive[int] = reactive(int(os.getenv("MONZO_PAY_DAY", "31")))
 
     def compose(self) -> ComposeResult:
-        pay_day_type_options = [
-            ("First day of the month", "first"),
-            ("Last day of the month", "last"),
-            ("Specific day of the month", "specific"),
-        ]
         container = Container(
             SpreadsheetIdInput(self.spreadsheet_id),
             CredentialsPathInput(self._credentials_path),
             PayDayTypeSelect(
-                pay_day_type_options, allow_blank=False, value=self.pay_day_type
+                _PAY_DAY_TYPE_OPTIONS, allow_blank=False, value=self.pay_day_type
             ),
             PayDayInput(str(self.pay_day), type="integer"),
         )
@@ -97,7 +108,7 @@ class SettingsModalScreen(ModalScreen[bool]):
 
     @property
     def credentials_path(self) -> Path:
-        return Path(self._credentials_path).expanduser()
+        return _expand_path(self._credentials_path)
 
     def action_cancel(self) -> None:
         """Cancel action triggered by ESC key."""
@@ -115,7 +126,7 @@ class SettingsModalScreen(ModalScreen[bool]):
     def on_key(self, event: Key) -> None:
         """Handle key events, specifically Enter key when inputs are focused."""
         if event.key == "enter":
-            if isinstance(self.focused, OptionList | Select):
+            if isinstance(self.focused, _SKIP_ENTER):
                 return
             self.action_save()
             event.prevent_default()
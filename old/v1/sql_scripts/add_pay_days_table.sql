@@ -14,7 +14,7 @@ effective_days AS (
         year,
         monthNum,
         LEAST(
-            ?,
+            getvariable('pay_day'),
             date_part('day', (
                 make_date(year, monthNum, 1) +
                 INTERVAL '1 month' -
@@ -1,5 +1,3 @@
-ALTER VIEW transactions RENAME TO RAW_TRANSACTIONS;
-
 CREATE OR REPLACE TABLE transactions
 AS SELECT
     raw_transactions.*,
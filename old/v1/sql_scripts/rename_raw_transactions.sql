@@ -0,0 +1 @@
+ALTER VIEW transactions RENAME TO RAW_TRANSACTIONS;
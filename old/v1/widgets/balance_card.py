@@ -17,30 +17,29 @@ class BalanceCard(Container, DataWidget):
     """Widget to display the balance."""
 
     def compose(self) -> ComposeResult:
-        self.sql_query = "select sum(amount) from transactions"
+        # One scan returns both the balance and the latest month's spending
+        self.sql_query = "select sum(amount) as balance, sum(amount * -1) filter (where amount < 0 and expenseMonthDate = (select max(expenseMonthDate) from transactions)) as spent from transactions"
         logger.debug("Composing BalanceCard")
         self.border_title = "Balance"
         self.add_class("card")
         yield Digits("0.00")
 
+    @staticmethod
+    def _format_value(value) -> str:
+        return f"{value:,.0f}" if value >= 1000 else f"{value:,.2f}"
+
     def update_balance(self) -> None:
         if not (self.data and self.data[0]):
             return
-        row = self.data[0]
-        value = row[0] or 0
-        string_value = f"{value:,.0f}" if value >= 1000 else f"{value:,.2f}"
-        self.query_one(Digits).update(string_value)
+        value = self.data[0][0] or 0
+        self.query_one(Digits).update(self._format_value(value))
 
     def update_subtitle(self) -> None:
-        query = "select sum(amount * -1) from transactions where amount < 0 and expenseMonthDate = (select max(expenseMonthDate) from transactions)"
-        data = self.run_query(query)
-        if not (data and data[0]):
+        spent = self.data[0][1] if self.data else None
+        if spent is None:
             self.border_subtitle = None
             return
-        row = data[0]
-        value = row[0]
-        string_value = f"{value:,.0f}" if value >= 1000 else f"{value:,.2f}"
-        self.border_subtitle = f"£{string_value} spent"
+        self.border_subtitle = f"£{self._format_value(spent)} spent"
 
     def watch_data(self, data: list[tuple]) -> None:
         logger.info("Updating BalanceCard")
@@ -1,12 +1,22 @@
 """Module containing the base DataWidget class."""
 
+from __future__ import annotations
+
 import logging
 import re
+from typing import TYPE_CHECKING
 from typing import Any
 
-from duckdb import DuckDBPyConnection
+from textual import work
 from textual.reactive import reactive
 from textual.widget import Widget
+from textual.worker import get_current_worker
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from duckdb import DuckDBPyConnection
+    from textual.widgets import DataTable
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +31,8 @@ class DataWidget(Widget):
     sql_query: reactive[str] = reactive("select 1;")
     sql_params: reactive[dict[str, Any]] = reactive({})
     _column_names: reactive[list[str]] = reactive([])
+    _pretty_columns: list[str] = []
+    _pretty_columns_for: list[str] | None = None
 
     @property
     def db(self) -> DuckDBPyConnection | None:
@@ -40,29 +52,93 @@ class DataWidget(Widget):
     def update(self, /, **kwargs) -> None:
         for key, value in kwargs.items():
             setattr(self, key, value)
-        self.fetch_data()
+        self.fetch_data_in_thread(self.sql_query, self.query_params())
+
+    def query_params(self) -> dict[str, Any]:
+        """Return the sql_params that the current sql_query refers to."""
+        return {
+            name: param
+            for name, param in self.sql_params.items()
+            if f"${name}" in self.sql_query
+        }
+
+    def cached_query(
+        self,
+        db: DuckDBPyConnection,
+        version: int,
+        query: str,
+        params: dict[str, Any],
+    ) -> tuple[list[str], list[tuple]]:
+        """Return a query's column names and rows, reusing the app's cached result.
+
+        version is the app's data_version, read when db was looked up, so a
+        result is never cached under a version newer than the data it saw.
+        """
+        app = self.app
+        cache = app.query_cache
+        key = (version, query.strip(), repr(sorted(params.items())))
+        result = cache.pop(key, None)
+        if result is None:
+            relation = db.sql(query, params=params)
+            result = relation.columns, relation.fetchall()
+        # Reinsert so the dict's order runs from least to most recently used
+        cache[key] = result
+        if len(cache) > app.QUERY_CACHE_SIZE:
+            cache.pop(next(iter(cache)), None)
+        return result
 
     def fetch_data(self) -> None:
         logger.info(f"Updating data on {self.__class__.__name__}")
-        params = {}
-        for name, param in self.sql_params.items():
-            if f"${name}" in self.sql_query:
-                params[name] = param
-        self.data = self.run_query(self.sql_query, params=params)
+        version, db = self.app.data_version, self.db
+        if not db:
+            self.data = []
+            return
+        _, self.data = self.cached_query(
+            db, version, self.sql_query, self.query_params()
+        )
         if not self.data:
             logger.info(f"No data returned for {self.__class__.__name__}")
 
+    @work(thread=True, exclusive=True, group="fetch")
+    def fetch_data_in_thread(self, query: str, params: dict[str, Any]) -> None:
+        """Run the query off the UI thread, so widgets can query concurrently."""
+        logger.info(f"Updating data on {self.__class__.__name__}")
+        version, db = self.app.data_version, self.db
+        if not db:
+            return
+        # Connections are not thread-safe; each thread queries its own cursor
+        cursor = db.cursor()
+        try:
+            column_names, data = self.cached_query(cursor, version, query, params)
+        except Exception as e:
+            logger.error(f"Error fetching data for {self.__class__.__name__}: {e}")
+            return
+        finally:
+            cursor.close()
+
+        if get_current_worker().is_cancelled:
+            return
+        # A cache hit hands back the very lists already on display; reactives
+        # would ignore them anyway, so skip the round trip to the UI thread
+        if data is self.data and column_names is self._column_names:
+            return
+        self.app.call_from_thread(self._set_data, column_names, data)
+
+    def _set_data(self, column_names: list[str], data: list[tuple]) -> None:
+        self._column_names = column_names
+        self.data = data
+        if not data:
+            logger.info(f"No data returned for {self.__class__.__name__}")
+
     def query_columns(self, query: str, *args, **kwargs) -> list[str]:
         if not self.db:
             return []
         return self.db.sql(query, *args, **kwargs).columns
 
     def fetch_column_names(self) -> None:
-        params = {}
-        for name, param in self.sql_params.items():
-            if f"${name}" in self.sql_query:
-                params[name] = param
-        self._column_names = self.query_columns(self.sql_query, params=params)
+        self._column_names = self.query_columns(
+            self.sql_query, params=self.query_params()
+        )
 
     @property
     def column_names(self) -> list[str]:
@@ -70,6 +146,17 @@ class DataWidget(Widget):
             self.fetch_column_names()
         return self._column_names
 
+    def fill_table(self, table: DataTable, rows: Iterable) -> None:
+        """Replace the table's rows, rebuilding its columns only if they changed."""
+        columns = self.pretty_columns()
+        with self.app.batch_update():
+            if [column.label.plain for column in table.columns.values()] == columns:
+                table.clear()
+            else:
+                table.clear(columns=True)
+                table.add_columns(*columns)
+            table.add_rows(rows)
+
     def _camel_to_human_readable(self, camel_string: str) -> str:
         """Convert a camel case string to a human readable capitalised string."""
         # Insert space before uppercase letters that follow lowercase letters or digits
@@ -82,6 +169,12 @@ class DataWidget(Widget):
         return self._snake_regex.sub(r" ", snake_string)
 
     def pretty_columns(self) -> list[str]:
-        camel_converted = map(self._camel_to_human_readable, self.column_names)
+        column_names = self.column_names
+        # Column lists are replaced, never mutated, so identity marks a change
+        if self._pretty_columns_for is column_names:
+            return self._pretty_columns
+        camel_converted = map(self._camel_to_human_readable, column_names)
         snake_converted = map(self._snake_to_human_readable, camel_converted)
-        return list(map(str.title, snake_converted))
+        self._pretty_columns = list(map(str.title, snake_converted))
+        self._pretty_columns_for = column_names
+        return self._pretty_columns
@@ -17,26 +17,15 @@ class LatestTransactionsTable(Container, DataWidget):
     """Widget to display the latest transactions."""
 
     def compose(self) -> ComposeResult:
-        self.sql_query = "select expenseMonth, date, time, name, category, amount * -1 as amount from transactions order by date desc, time desc"
+        self.sql_query = "select expenseMonth, date, strftime(date + time, '%H:%M') as time, name, category, printf('£%,.2f', amount * -1) as amount from transactions order by transactions.date desc, transactions.time desc"
         logger.debug("Composing LatestTransactionsTable")
         self.border_title = "Latest Transactions"
         self.add_class("card")
-        yield DataTable(zebra_stripes=True, cursor_type="row")
+        self._table = DataTable(zebra_stripes=True, cursor_type="row")
+        yield self._table
 
     def update_transactions(self) -> None:
-        table = self.query_one(DataTable)
-        table.clear(columns=True)
-        table.add_columns(*self.pretty_columns())
-        table.add_rows(self.formatted_data())
-
-    def format_row(self, row: tuple) -> list:
-        new_row = list(row)
-        new_row[2] = new_row[2].strftime("%H:%M")
-        new_row[5] = f"£{new_row[5]:,.2f}"
-        return new_row
-
-    def formatted_data(self) -> list[list]:
-        return [self.format_row(row) for row in self.data]
+        self.fill_table(self._table, self.data)
 
     def watch_data(self, data: list[tuple]) -> None:
         logger.info("Updating LatestTransactionsTable")
@@ -1,6 +1,7 @@
 """Module defining the logo widget."""
 
 import logging
+from functools import cache
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -9,21 +10,17 @@ from textual.widgets import Label
 
 logger = logging.getLogger(__name__)
 
+_LOGO_PATH = Path(__file__).parent.parent / "assets" / "logo.txt"
+
+
+@cache
+def _logo_text() -> str:
+    """Logo artwork, read from the assets once."""
+    return _LOGO_PATH.read_text(encoding="utf-8")
+
 
 class Logo(Container):
     """Widget displaying the Monzo logo."""
 
     def compose(self) -> ComposeResult:
-        yield Label()
-
-    def on_mount(self) -> None:
-        label = self.query_one(Label)
-        with open(self.logo_path) as file:
-            label.update(file.read())
-
-    @property
-    def logo_path(self) -> Path:
-        widgets = Path(__file__).parent
-        app = widgets.parent
-        assets = app / "assets"
-        return assets / "logo.txt"
+        yield Label(_logo_text())
@@ -13,6 +13,9 @@ __all__ = ["MonthlySpendChart"]
 
 logger = logging.getLogger(__name__)
 
+_LATEST_MONTHS = "select expenseMonth, sum(amount * -1)::double as spend, expenseMonthDate from transactions where category not in $exclusions and amount < 0 group by expenseMonth, expenseMonthDate order by expenseMonthDate desc limit 12"
+_MONTHLY_SPEND_SQL = f"select * from ({_LATEST_MONTHS}) order by expenseMonthDate"
+
 
 class MonthlySpendChart(Container, DataWidget):
     """Widget to display the monthly spend chart."""
@@ -20,19 +23,18 @@ class MonthlySpendChart(Container, DataWidget):
     exclusions: reactive[tuple] = reactive(())
 
     def compose(self) -> ComposeResult:
-        self.sql_query = "select expenseMonth, sum(amount * -1), expenseMonthDate as total from transactions where category not in $exclusions and amount < 0 group by expenseMonth, expenseMonthDate order by expenseMonthDate"
+        self.sql_query = _MONTHLY_SPEND_SQL
         logger.debug("Composing MonthlySpendChart")
         self.border_title = "Monthly Spend Chart"
         self.add_class("card")
-        yield PlotextPlot()
+        self._chart = PlotextPlot()
+        yield self._chart
 
     def update_monthly_spend(self) -> None:
-        chart = self.query_one(PlotextPlot)
+        chart = self._chart
         plt = chart.plt
-        plt.clear_data()
-        chart.refresh()
-        months = [row[0] for row in self.data[-12:]]
-        amounts = [float(row[1]) for row in self.data[-12:]]
+        months = [row[0] for row in self.data]
+        amounts = [row[1] for row in self.data]
         plt.clear_figure()
         plt.bar(months, amounts, width=5 / 7)
         chart.refresh()
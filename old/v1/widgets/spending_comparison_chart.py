@@ -13,6 +13,12 @@ __all__ = ["SpendingComparisonChart"]
 
 logger = logging.getLogger(__name__)
 
+_SUB_QUERY = "select distinct expenseMonth from transactions order by expenseMonthDate desc limit 2"
+_CTE = f"pivot transactions on expenseMonth in ({_SUB_QUERY}) using sum(amount * -1) group by category order by 3 desc"
+# Month columns are named after the months, so check every non-category one
+_SPENT = "list_bool_or([coalesce(spend, 0) <> 0 for spend in [*columns(* exclude (category))]])"
+_SPENDING_SQL = f"with categories as ({_CTE}) select category, coalesce(columns(* exclude (category)), 0)::double from categories where category not in $exclusions and {_SPENT} order by 3 desc limit 7"
+
 
 class SpendingComparisonChart(Container, DataWidget):
     """Widget to display the last month's category chart."""
@@ -20,36 +26,33 @@ class SpendingComparisonChart(Container, DataWidget):
     exclusions: reactive[tuple] = reactive(())
 
     def compose(self) -> ComposeResult:
-        sub_query: str = "select distinct expenseMonth from transactions order by expenseMonthDate desc limit 2"
-        cte = f"pivot transactions on expenseMonth in ({sub_query}) using sum(amount * -1) group by category order by 3 desc"
-        self.sql_query = f"with categories as ({cte}) select * from categories where category not in $exclusions"
+        self.sql_query = _SPENDING_SQL
         logger.debug("Composing LastMonthCategoryChart")
         self.border_title = "Spending Last Month"
         self.add_class("card")
-        yield PlotextPlot()
+        self._chart = PlotextPlot()
+        yield self._chart
 
     def watch_exclusions(self, exclusions: list[str]) -> None:
         self.sql_params = {"exclusions": exclusions}
 
     def update_last_month(self) -> None:
-        chart = self.query_one(PlotextPlot)
+        chart = self._chart
         plt = chart.plt
-        plt.clear_data()
-        chart.refresh()
         if not self.data:
+            plt.clear_data()
+            chart.refresh()
             return
         columns = self.pretty_columns()
-        categories, this_month, last_month = [], [], []
-        for row in self.data[::-1]:
-            if row[1] or row[2]:
-                categories.append(row[0])
-                this_month.append(float(row[1] or 0))
-                last_month.append(float(row[2] or 0))
+        # Rows arrive largest first; plotext draws the first bar at the bottom
+        categories, this_month, last_month = map(
+            list, zip(*self.data[::-1], strict=True)
+        )
         labels = columns[-2:]
         plt.clear_figure()
         plt.multiple_bar(
-            categories[-7:],
-            [this_month[-7:], last_month[-7:]],
+            categories,
+            [this_month, last_month],
             orientation="horizontal",
             labels=labels,
             width=2 / 7,
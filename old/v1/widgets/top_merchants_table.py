@@ -17,25 +17,17 @@ class TopMerchantsTable(Container, DataWidget):
     """Widget to display the top merchants."""
 
     def compose(self) -> ComposeResult:
-        self.sql_query = "select name, sum(amount * -1) as amount, count(amount) as txns from transactions where expenseMonthDate = (select max(expenseMonthDate) from transactions) group by name order by amount desc"
+        self.sql_query = "select name, printf('£%,.2f', sum(amount * -1)) as amount, count(amount) as txns from transactions where expenseMonthDate = (select max(expenseMonthDate) from transactions) group by name order by sum(amount * -1) desc"
         logger.debug("Composing TopMerchantsTable")
         self.border_title = "Top Merchants"
         self.add_class("card")
-        yield DataTable(zebra_stripes=True, cursor_type="row", id="top-merchants-table")
+        self._table = DataTable(
+            zebra_stripes=True, cursor_type="row", id="top-merchants-table"
+        )
+        yield self._table
 
     def update_merchants(self) -> None:
-        table = self.query_one(DataTable)
-        table.clear(columns=True)
-        table.add_columns(*self.pretty_columns())
-        table.add_rows(self.formatted_data())
-
-    def format_row(self, row: tuple) -> list:
-        new_row = list(row)
-        new_row[1] = f"£{new_row[1]:,.2f}"
-        return new_row
-
-    def formatted_data(self) -> list[list]:
-        return [self.format_row(row) for row in self.data]
+        self.fill_table(self._table, self.data)
 
     def watch_data(self, data: list[tuple]) -> None:
         logger.info("Updating Top Merchants")
@@ -2,6 +2,7 @@
 
 import logging
 import random
+from collections.abc import Callable
 from dataclasses import dataclass
 from dataclasses import field
 from datetime import datetime
@@ -66,6 +67,11 @@ class DataService:
         self._event_bus = get_event_bus()
         self._is_initialized = False
 
+        # Aggregation results keyed by (data version, query arguments); the
+        # version is bumped whenever the transactions change
+        self._data_version = 0
+        self._query_cache: dict[tuple, list] = {}
+
         # Mock data generators
         self._categories = [
             "Groceries",
@@ -111,6 +117,11 @@ class DataService:
         """Get current data state."""
         return self._state
 
+    @property
+    def data_version(self) -> int:
+        """Counter bumped every time the transactions are reloaded."""
+        return self._data_version
+
     def get_balance(self) -> float:
         """Get current balance."""
         return self._state.balance
@@ -172,6 +183,7 @@ class DataService:
             self._generate_mock_transactions()
             logger.debug("DataService: Calculating statistics")
             self._calculate_statistics()
+            self._invalidate_query_cache()
 
             # Update state
             self._state.is_loading = False
@@ -286,11 +298,33 @@ class DataService:
         )
         self._event_bus.emit_simple(event_type, data=event_data, source="DataService")
 
+    def _invalidate_query_cache(self) -> None:
+        """Drop cached aggregations after the transactions change."""
+        self._data_version += 1
+        self._query_cache.clear()
+
+    def _cached_query(self, key: tuple, compute: Callable[[], list]) -> list:
+        """Return a cached aggregation for the current data, computing on a miss."""
+        key = (self._data_version, *key)
+        result = self._query_cache.get(key)
+        if result is None:
+            result = self._query_cache[key] = compute()
+        return list(result)
+
     def get_top_categories(
         self, limit: int = 5, exclude: list[str] = None
     ) -> list[tuple[str, float, int]]:
         """Get top spending categories."""
-        exclude = exclude or []
+        exclude = frozenset(exclude or ())
+        return self._cached_query(
+            ("top_categories", limit, exclude),
+            lambda: self._compute_top_categories(limit, exclude),
+        )
+
+    def _compute_top_categories(
+        self, limit: int, exclude: frozenset[str]
+    ) -> list[tuple[str, float, int]]:
+        """Aggregate spending per category, largest first."""
 
         category_totals = {}
         category_counts = {}
@@ -317,6 +351,12 @@ class DataService:
 
     def get_top_merchants(self, limit: int = 5) -> list[tuple[str, float, int]]:
         """Get top spending merchants."""
+        return self._cached_query(
+            ("top_merchants", limit), lambda: self._compute_top_merchants(limit)
+        )
+
+    def _compute_top_merchants(self, limit: int) -> list[tuple[str, float, int]]:
+        """Aggregate spending per merchant, largest first."""
         merchant_totals = {}
         merchant_counts = {}
 
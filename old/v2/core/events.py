@@ -2,6 +2,7 @@
 
 import logging
 from collections.abc import Callable
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
@@ -68,6 +69,15 @@ class EventBus:
             self._subscribers[event_type].discard(callback)
             logger.debug(f"Unsubscribed from {event_type.value}")
 
+    def unsubscribe_many(
+        self, subscriptions: Iterable[tuple[EventType, Callable[[AppEvent], None]]]
+    ) -> None:
+        """Unsubscribe several (event type, callback) pairs in one pass."""
+        for event_type, callback in subscriptions:
+            subscribers = self._subscribers.get(event_type)
+            if subscribers is not None:
+                subscribers.discard(callback)
+
     def emit(self, event: AppEvent) -> None:
         """Emit an event to all subscribers."""
         logger.debug(f"Emitting event: {event}")
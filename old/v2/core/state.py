@@ -281,6 +281,11 @@ class AppState:
                 logger.error(f"Application error: {error}")
             self._emit_state_change()
 
+    def reset(self) -> None:
+        """Clear transient loading and error state."""
+        self.update_loading_state(False)
+        self.update_error_state(None)
+
     def shutdown(self) -> None:
         """Clean up state on application shutdown."""
         if self._initialized and self._event_bus:
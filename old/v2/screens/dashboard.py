@@ -1,6 +1,7 @@
 """Dashboard screen for the Monzo app v2 with reactive components."""
 
 import logging
+from typing import Any
 
 from core import AppEvent
 from textual.app import ComposeResult
@@ -9,6 +10,7 @@ from textual.containers import Grid
 from textual.reactive import reactive
 from textual.widgets import Footer
 from textual.widgets import Header
+from widgets.base import RefreshCoordinator
 from widgets.dashboard import BalanceCard
 from widgets.dashboard import DataStatusCard
 from widgets.dashboard import LatestTransactionsTable
@@ -40,6 +42,11 @@ class DashboardScreen(StateAwareScreen):
     _debug_mode: reactive[bool] = reactive(False)
     _current_view: reactive[str] = reactive("overview")
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Shared by every DataWidget on the dashboard to batch their queries
+        self.refresh_coordinator = RefreshCoordinator()
+
     def compose(self) -> ComposeResult:
         """Compose the dashboard screen layout."""
         yield Header()
@@ -78,6 +85,11 @@ class DashboardScreen(StateAwareScreen):
         super().on_mount()
         self.title = "Monzo Analytics Dashboard"
         self.sub_title = "Reactive Financial Analytics"
+        self.run_worker(
+            self.refresh_coordinator.run(),
+            exclusive=True,
+            group="refresh-coordinator",
+        )
         logger.info("Dashboard screen mounted and ready")
 
     def on_state_updated(self) -> None:
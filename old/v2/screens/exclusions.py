@@ -6,6 +6,7 @@ from core import AppEvent
 from core import get_data_service
 from core import get_settings_service
 from textual import on
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.containers import Horizontal
@@ -13,6 +14,7 @@ from textual.reactive import reactive
 from textual.widgets import Button
 from textual.widgets import Label
 from textual.widgets import SelectionList
+from textual.widgets.selection_list import Selection
 
 from screens.base import ConfigurableModalScreen
 
@@ -30,19 +32,9 @@ class ExclusionsScreen(ConfigurableModalScreen):
     ]
 
     # Reactive properties
-    available_categories: reactive[list[str]] = reactive([])
+    available_categories: reactive[tuple[str, ...]] = reactive((), always_update=False)
     selected_exclusions: reactive[list[str]] = reactive([])
 
-    def on_mount(self) -> None:
-        """Called when screen is mounted."""
-        super().on_mount()
-        if not hasattr(self, "_settings_service"):
-            self._settings_service = get_settings_service()
-        if not hasattr(self, "_data_service"):
-            self._data_service = get_data_service()
-        if not hasattr(self, "_selection_list"):
-            self._selection_list = None
-
     def compose(self) -> ComposeResult:
         """Compose the exclusions modal layout."""
         with Container(classes="exclusions-modal"):
@@ -54,8 +46,11 @@ class ExclusionsScreen(ConfigurableModalScreen):
             )
 
             with Container(classes="selection-container"):
+                # Placeholder shown until the categories worker completes
                 self._selection_list = SelectionList(
-                    id="category-selection-list", classes="category-list"
+                    Selection("Loading categories...", "", disabled=True),
+                    id="category-selection-list",
+                    classes="category-list",
                 )
                 yield self._selection_list
 
@@ -96,23 +91,47 @@ class ExclusionsScreen(ConfigurableModalScreen):
     def on_mount(self) -> None:
         """Called when the exclusions modal is mounted."""
         super().on_mount()
+        if not hasattr(self, "_settings_service"):
+            self._settings_service = get_settings_service()
+        if not hasattr(self, "_data_service"):
+            self._data_service = get_data_service()
+        if not hasattr(self, "_selection_list"):
+            self._selection_list = None
         self.border_title = "Category Exclusions"
         self.border_subtitle = "Press Space to toggle, Ctrl+S to apply, Esc to cancel"
         self._load_categories()
         logger.debug("Exclusions modal mounted")
 
+    @work(exclusive=True, thread=True)
     def _load_categories(self) -> None:
-        """Load available categories and current exclusions."""
+        """Load available categories and current exclusions in the background."""
         try:
             # Get available categories from data service
             categories = self._data_service.get_categories()
-            self.available_categories = sorted(categories)
 
             # Get current exclusions from settings
-            current_exclusions = self._settings_service.settings.exclusions
-            self.selected_exclusions = current_exclusions.copy()
+            current_exclusions = self._settings_service.settings.exclusions.copy()
 
-            # Populate the selection list
+        except Exception as e:
+            logger.error(f"Error loading categories: {e}")
+            self.app.call_from_thread(self._show_load_error, e)
+            return
+
+        self.app.call_from_thread(
+            self._apply_categories, categories, current_exclusions
+        )
+
+    def _apply_categories(
+        self, categories: list[str], current_exclusions: list[str]
+    ) -> None:
+        """Apply loaded categories and exclusions to the modal."""
+        try:
+            # Set both before populating so the list is built once, with the
+            # current exclusions already in place
+            self.set_reactive(
+                ExclusionsScreen.available_categories, tuple(sorted(categories))
+            )
+            self.set_reactive(ExclusionsScreen.selected_exclusions, current_exclusions)
             self._populate_selection_list()
 
             logger.debug(
@@ -123,6 +142,15 @@ class ExclusionsScreen(ConfigurableModalScreen):
             logger.error(f"Error loading categories: {e}")
             self.app.notify(f"Error loading categories: {e}", severity="error")
 
+    def _show_load_error(self, error: Exception) -> None:
+        """Replace the loading placeholder after categories failed to load."""
+        if self._selection_list:
+            self._selection_list.clear_options()
+            self._selection_list.add_option(
+                Selection("Could not load categories", "", disabled=True)
+            )
+        self.app.notify(f"Error loading categories: {error}", severity="error")
+
     def _populate_selection_list(self) -> None:
         """Populate the selection list with categories."""
         if not self._selection_list:
@@ -131,18 +159,15 @@ class ExclusionsScreen(ConfigurableModalScreen):
         # Clear existing options
         self._selection_list.clear_options()
 
-        # Add categories as options
-        for category in self.available_categories:
-            self._selection_list.add_option(category, category)
+        # Add all categories as options in a single call
+        self._selection_list.add_options(
+            [Selection(category, category) for category in self.available_categories]
+        )
 
-        # Set initial selections
+        # Set initial selections; option values are the category names
         for category in self.selected_exclusions:
             if category in self.available_categories:
-                try:
-                    index = self.available_categories.index(category)
-                    self._selection_list.select(index)
-                except (ValueError, IndexError):
-                    logger.warning(f"Could not select category: {category}")
+                self._selection_list.select(category)
 
         self._update_status_counts()
 
@@ -166,12 +191,7 @@ class ExclusionsScreen(ConfigurableModalScreen):
 
         # Update selected exclusions based on current selection
         if self._selection_list:
-            selected_indices = self._selection_list.selected
-            self.selected_exclusions = [
-                self.available_categories[i]
-                for i in selected_indices
-                if i < len(self.available_categories)
-            ]
+            self.selected_exclusions = list(self._selection_list.selected)
 
         logger.debug(
             f"Selection changed: {len(self.selected_exclusions)} categories selected"
@@ -180,10 +200,9 @@ class ExclusionsScreen(ConfigurableModalScreen):
     @on(Button.Pressed, "#select-all-button")
     def on_select_all_pressed(self) -> None:
         """Handle select all button press."""
-        if self._selection_list:
-            # Select all categories
-            for i in range(len(self.available_categories)):
-                self._selection_list.select(i)
+        # Skip while only the disabled placeholder option is listed
+        if self._selection_list and self.available_categories:
+            self._selection_list.select_all()
 
             self.app.notify("All categories selected for exclusion", timeout=2)
 
@@ -216,15 +235,8 @@ class ExclusionsScreen(ConfigurableModalScreen):
         if not self._selection_list:
             return {"exclusions": []}
 
-        # Get currently selected categories
-        selected_indices = self._selection_list.selected
-        selected_categories = [
-            self.available_categories[i]
-            for i in selected_indices
-            if i < len(self.available_categories)
-        ]
-
-        return {"exclusions": selected_categories}
+        # Option values are the category names themselves
+        return {"exclusions": list(self._selection_list.selected)}
 
     def action_save(self) -> None:
         """Save exclusions action."""
@@ -259,7 +271,7 @@ class ExclusionsScreen(ConfigurableModalScreen):
         super().action_cancel()
 
     # Reactive property watchers
-    def watch_available_categories(self, categories: list[str]) -> None:
+    def watch_available_categories(self, categories: tuple[str, ...]) -> None:
         """React to available categories changes."""
         if hasattr(self, "_selection_list") and self._selection_list:
             self._populate_selection_list()
@@ -1,6 +1,7 @@
 """Settings modal screen for configuration management."""
 
 import logging
+from functools import partial
 from pathlib import Path
 
 from core import get_settings_service
@@ -10,6 +11,7 @@ from textual.containers import Container
 from textual.containers import Grid
 from textual.containers import Horizontal
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import Button
 from textual.widgets import Input
 from textual.widgets import Label
@@ -40,6 +42,18 @@ class SettingsScreen(ConfigurableModalScreen):
     _form_widgets: reactive[dict] = reactive({})
     _validation_errors: reactive[dict] = reactive({})
 
+    # Reactive properties mirrored onto the form widget with the same key
+    _REACTIVE_TO_WIDGET = (
+        "spreadsheet_id",
+        "credentials_path",
+        "pay_day_type",
+        "pay_day",
+        "theme",
+    )
+
+    # Pending debounced validation triggered by typing
+    _validate_timer: Timer | None = None
+
     def on_mount(self) -> None:
         """Called when screen is mounted."""
         super().on_mount()
@@ -47,6 +61,8 @@ class SettingsScreen(ConfigurableModalScreen):
             self._settings_service = get_settings_service()
         self.border_title = "Settings"
         self.border_subtitle = "Press Ctrl+S to save, Esc to cancel"
+        for name in self._REACTIVE_TO_WIDGET:
+            self.watch(self, name, partial(self._sync_widget, name), init=False)
         # Load settings after compose has run
         self.call_after_refresh(self._on_widgets_ready)
         logger.debug("Settings modal mounted")
@@ -158,43 +174,66 @@ class SettingsScreen(ConfigurableModalScreen):
         """Load current settings into the form."""
         settings = self._settings_service.settings
 
-        # Update reactive properties
-        self.spreadsheet_id = settings.spreadsheet_id or ""
-        self.credentials_path = settings.credentials_path
-        self.pay_day_type = settings.pay_day_type
-        self.pay_day = settings.pay_day
-        self.theme = settings.theme
-
-        # Update form widgets
-        self._form_widgets["spreadsheet_id"].value = self.spreadsheet_id
-        self._form_widgets["credentials_path"].value = self.credentials_path
-        self._form_widgets["pay_day_type"].value = self.pay_day_type
-        self._form_widgets["pay_day"].value = str(self.pay_day)
-        self._form_widgets["theme"].value = self.theme
-
-        # Update pay day input state based on type
-        self._update_pay_day_input_state()
+        # Filling the form is not a user edit, so it must not trigger validation
+        with self.prevent(Input.Changed, Select.Changed):
+            # Update reactive properties
+            self.spreadsheet_id = settings.spreadsheet_id or ""
+            self.credentials_path = settings.credentials_path
+            self.pay_day_type = settings.pay_day_type
+            self.pay_day = settings.pay_day
+            self.theme = settings.theme
+
+            # Update form widgets
+            self._form_widgets["spreadsheet_id"].value = self.spreadsheet_id
+            self._form_widgets["credentials_path"].value = self.credentials_path
+            self._form_widgets["pay_day_type"].value = self.pay_day_type
+            self._form_widgets["pay_day"].value = str(self.pay_day)
+            self._form_widgets["theme"].value = self.theme
+
+            # Update pay day input state based on type
+            self._update_pay_day_input_state()
 
     def _update_pay_day_input_state(self) -> None:
         """Update pay day input based on the selected type."""
         pay_day_input = self._form_widgets["pay_day"]
 
-        if self.pay_day_type == "first":
-            pay_day_input.value = "1"
-            pay_day_input.disabled = True
-        elif self.pay_day_type == "last":
-            pay_day_input.value = "31"
-            pay_day_input.disabled = True
-        else:  # specific
-            pay_day_input.disabled = False
-            if pay_day_input.value in ["1", "31"]:
-                pay_day_input.value = str(self.pay_day)
+        with self.prevent(Input.Changed):
+            if self.pay_day_type == "first":
+                pay_day_input.value = "1"
+                pay_day_input.disabled = True
+            elif self.pay_day_type == "last":
+                pay_day_input.value = "31"
+                pay_day_input.disabled = True
+            else:  # specific
+                pay_day_input.disabled = False
+                if pay_day_input.value in ["1", "31"]:
+                    pay_day_input.value = str(self.pay_day)
 
     @on(Select.Changed, "#pay-day-type-select")
     def on_pay_day_type_changed(self, event: Select.Changed) -> None:
         """Handle pay day type selection changes."""
+        # The Select also posts Changed for its initial value on mount; only a
+        # real change updates the form and validates
+        if event.value == self.pay_day_type:
+            return
+        # The watcher updates the pay day input
         self.pay_day_type = event.value
-        self._update_pay_day_input_state()
+
+        # Selecting is a discrete event, so validate straight away
+        self._cancel_pending_validation()
+        self._validate_form()
+
+    @on(Input.Changed, "#spreadsheet-id-input, #credentials-path-input, #pay-day-input")
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Validate typed input once the user pauses."""
+        self._cancel_pending_validation()
+        self._validate_timer = self.set_timer(0.3, self._validate_form)
+
+    def _cancel_pending_validation(self) -> None:
+        """Stop any debounced validation that has not yet run."""
+        if self._validate_timer is not None:
+            self._validate_timer.stop()
+            self._validate_timer = None
 
     @on(Button.Pressed, "#save-button")
     def on_save_button_pressed(self) -> None:
@@ -260,6 +299,7 @@ class SettingsScreen(ConfigurableModalScreen):
 
     def get_save_data(self) -> dict:
         """Get the data to save from the form."""
+        self._cancel_pending_validation()
         if not self._validate_form():
             raise ValueError("Form validation failed")
 
@@ -308,29 +348,14 @@ class SettingsScreen(ConfigurableModalScreen):
         logger.debug("Settings modal cancelled")
         super().action_cancel()
 
-    # Watchers for reactive properties
-    def watch_spreadsheet_id(self, value: str) -> None:
-        """React to spreadsheet ID changes."""
-        if hasattr(self, "_form_widgets") and "spreadsheet_id" in self._form_widgets:
-            self._form_widgets["spreadsheet_id"].value = value
-
-    def watch_credentials_path(self, value: str) -> None:
-        """React to credentials path changes."""
-        if hasattr(self, "_form_widgets") and "credentials_path" in self._form_widgets:
-            self._form_widgets["credentials_path"].value = value
+    def _sync_widget(self, key: str, value: object) -> None:
+        """Write a reactive form value back to its widget if it differs."""
+        widget = self._form_widgets.get(key)
+        if widget is not None and widget.value != str(value):
+            with self.prevent(Input.Changed, Select.Changed):
+                widget.value = str(value)
 
     def watch_pay_day_type(self, value: str) -> None:
         """React to pay day type changes."""
-        if hasattr(self, "_form_widgets") and "pay_day_type" in self._form_widgets:
-            self._form_widgets["pay_day_type"].value = value
+        if "pay_day" in self._form_widgets:
             self._update_pay_day_input_state()
-
-    def watch_pay_day(self, value: int) -> None:
-        """React to pay day changes."""
-        if hasattr(self, "_form_widgets") and "pay_day" in self._form_widgets:
-            self._form_widgets["pay_day"].value = str(value)
-
-    def watch_theme(self, value: str) -> None:
-        """React to theme changes."""
-        if hasattr(self, "_form_widgets") and "theme" in self._form_widgets:
-            self._form_widgets["theme"].value = value
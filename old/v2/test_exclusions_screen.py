@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Textual tests for toggling and saving category exclusions."""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from screens.exclusions import ExclusionsScreen
+from textual.app import App
+from textual.widgets import SelectionList
+
+
+class StubDataService:
+    """Data service returning a fixed set of categories."""
+
+    def get_categories(self) -> list[str]:
+        return ["Groceries", "Bills", "Eating out"]
+
+
+class StubSettingsService:
+    """Settings service recording the exclusions it is given."""
+
+    def __init__(self, exclusions: list[str]):
+        self.settings = SimpleNamespace(exclusions=exclusions)
+        self.saved: list[str] | None = None
+
+    def set_exclusions(self, exclusions: list[str]) -> None:
+        self.saved = exclusions
+
+
+async def test_toggle_and_save_exclusions():
+    """Toggling a category and saving stores category names, not indices."""
+    app = App()
+    async with app.run_test() as pilot:
+        settings_service = StubSettingsService(["Bills"])
+        screen = ExclusionsScreen()
+        screen._data_service = StubDataService()
+        screen._settings_service = settings_service
+
+        results = []
+        app.push_screen(screen, results.append)
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        selection_list = screen.query_one(SelectionList)
+        assert selection_list.selected == ["Bills"]
+
+        # Options are sorted: Bills, Eating out, Groceries
+        selection_list.focus()
+        selection_list.highlighted = 2
+        await pilot.press("space")
+        assert screen.selected_exclusions == ["Bills", "Groceries"]
+
+        await pilot.press("ctrl+s")
+        await pilot.pause()
+
+        assert settings_service.saved == ["Bills", "Groceries"]
+        assert results == [{"exclusions": ["Bills", "Groceries"]}]
+
+
+if __name__ == "__main__":
+    # Run tests directly if script is executed
+    pytest.main([__file__, "-v"])
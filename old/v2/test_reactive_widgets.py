@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 """Proper Textual tests for reactive loading states using run_test framework."""
 
+import asyncio
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
 # Add the current directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from core import EventType
 from core import get_app_state
 from core import get_data_service
 from core import get_event_bus
@@ -16,34 +20,98 @@ from textual.app import App
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.containers import Vertical
+from textual.pilot import Pilot
+from textual.screen import Screen
+from widgets.base import DataWidget
+from widgets.base import RefreshCoordinator
+from widgets.base import StateAwareWidget
 from widgets.dashboard.balance_card import BalanceCard
 from widgets.dashboard.info_cards import DataStatusCard
 from widgets.reactive_label import CurrencyLabel
 from widgets.reactive_label import LoadingLabel
+from widgets.reactive_label import ReactiveLabel
 
 
-class TestLoadingWidget(App):
-    """Simple test app with just a LoadingLabel widget."""
+async def wait_until(
+    pilot: Pilot, predicate: Callable[[], bool], timeout: float = 1.0
+) -> None:
+    """Pump messages until predicate is true, failing after timeout seconds."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError("Timed out waiting for condition")
+        await pilot.pause(0)
 
-    def compose(self) -> ComposeResult:
-        yield LoadingLabel(id="loading-label")
+
+def label_text(label: ReactiveLabel) -> str:
+    """Return the text currently displayed by a reactive label."""
+    return str(label._label.renderable)
+
+
+def is_loading(label: LoadingLabel) -> bool:
+    """Return True if the label is showing a loading message."""
+    text = label_text(label)
+    return "Loading" in text or "Refreshing" in text
+
+
+class RefreshCountingWidget(StateAwareWidget):
+    """State-aware widget that counts its content refreshes."""
+
+    refreshes = 0
+
+    def on_data_updated(self, event) -> None:
+        self._schedule_refresh()
+
+    def on_exclusions_changed(self, event) -> None:
+        self._schedule_refresh()
+
+    def _refresh_content(self) -> None:
+        self.refreshes += 1
 
 
-class TestBalanceCard(App):
-    """Test app with BalanceCard widget."""
+class RefreshCountingApp(App):
+    """Test app holding a single refresh-counting widget."""
 
     def compose(self) -> ComposeResult:
-        yield BalanceCard(id="balance-card")
+        yield RefreshCountingWidget()
 
 
-class TestDataStatusCard(App):
-    """Test app with DataStatusCard widget."""
+class CoordinatedScreen(Screen):
+    """Screen whose data widgets share a running RefreshCoordinator."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.refresh_coordinator = RefreshCoordinator()
 
     def compose(self) -> ComposeResult:
-        yield DataStatusCard(id="data-status-card")
+        for widget_id in ("first", "second", "third"):
+            yield DataWidget(id=widget_id)
+
+    def on_mount(self) -> None:
+        self.run_worker(self.refresh_coordinator.run(), exclusive=True)
+
+
+class CoordinatedApp(App):
+    """Test app showing a CoordinatedScreen."""
+
+    def on_mount(self) -> None:
+        self.push_screen(CoordinatedScreen())
+
+
+def counting_query(calls: dict[str, int], name: str, fail: bool = False):
+    """Return a query function that records each call under name."""
+
+    def query() -> list:
+        calls[name] = calls.get(name, 0) + 1
+        if fail:
+            raise ValueError(f"{name} failed")
+        return [name]
+
+    return query
 
 
-class TestMultipleWidgets(App):
+class MultipleWidgetsApp(App):
     """Test app with multiple reactive widgets."""
 
     def compose(self) -> ComposeResult:
@@ -55,264 +123,395 @@ class TestMultipleWidgets(App):
                 yield CurrencyLabel(id="standalone-currency")
 
 
-@pytest.mark.asyncio
-async def test_loading_label_reactive_state():
-    """Test that LoadingLabel properly reacts to is_loading state changes."""
-    app = TestLoadingWidget()
-
+@pytest_asyncio.fixture(scope="module")
+async def shared_app():
+    """Run one app holding every widget under test for the whole module."""
+    app = MultipleWidgetsApp()
     async with app.run_test() as pilot:
-        # Get the widget and app state
-        loading_label = app.query_one("#loading-label", LoadingLabel)
-        app_state = get_app_state()
-
-        # Initial state should be "Ready" (not loading)
-        await pilot.pause(0.1)  # Allow initial rendering
-        assert "Ready" in loading_label._label.renderable or "Up to date" in str(
-            loading_label._label.renderable
-        )
-
-        # Simulate loading state change to True
-        app_state.update_loading_state(True)
-        await pilot.pause(0.1)  # Allow reactive update
-
-        # Should now show loading text
-        loading_text = str(loading_label._label.renderable)
-        assert "Loading" in loading_text or "Refreshing" in loading_text
+        yield app, pilot
 
-        # Simulate loading state change to False
-        app_state.update_loading_state(False)
-        await pilot.pause(0.1)  # Allow reactive update
 
-        # Should now show ready text again
-        ready_text = str(loading_label._label.renderable)
-        assert "Ready" in ready_text or "Up to date" in ready_text
+@pytest.fixture(autouse=True)
+def reset_app_state():
+    """Clear loading and error state left behind by the previous test."""
+    get_app_state().reset()
 
 
-@pytest.mark.asyncio
-async def test_balance_card_reactive_flow():
-    """Test that BalanceCard properly reacts to data updates."""
-    app = TestBalanceCard()
+async def test_loading_label_reactive_state(shared_app):
+    """Test that LoadingLabel properly reacts to is_loading state changes."""
+    app, pilot = shared_app
 
-    async with app.run_test() as pilot:
-        # Get the balance card and services
-        balance_card = app.query_one("#balance-card", BalanceCard)
-        app_state = get_app_state()
-        data_service = get_data_service()
+    # Get the widget and app state
+    loading_label = app.query_one("#standalone-loading", LoadingLabel)
+    app_state = get_app_state()
 
-        # Wait for initial rendering
-        await pilot.pause(0.1)
+    # Initial state should be "Ready" (not loading)
+    await pilot.pause()  # Allow initial rendering
+    initial_text = label_text(loading_label)
+    assert "Ready" in initial_text or "Up to date" in initial_text
 
-        # Check initial state - should show ready/not loading
-        loading_labels = balance_card.query("LoadingLabel")
-        if loading_labels:
-            loading_label = loading_labels.first()
-            initial_text = str(loading_label._label.renderable)
-            # Should not show loading initially
-            assert "Loading" not in initial_text and "Refreshing" not in initial_text
+    # Simulate loading state change to True
+    app_state.update_loading_state(True)
+    await wait_until(pilot, lambda: is_loading(loading_label))
 
-        # Trigger a data refresh which should show loading state
-        await data_service.refresh_data()
-        await pilot.pause(0.1)  # Allow reactive updates
+    # Should now show loading text
+    loading_text = label_text(loading_label)
+    assert "Loading" in loading_text or "Refreshing" in loading_text
 
-        # After refresh, should show ready state
-        if loading_labels:
-            loading_label = loading_labels.first()
-            final_text = str(loading_label._label.renderable)
-            assert "Ready" in final_text or "Up to date" in final_text
+    # Simulate loading state change to False
+    app_state.update_loading_state(False)
+    await wait_until(pilot, lambda: not is_loading(loading_label))
 
-        # Check that balance was updated
-        currency_labels = balance_card.query("CurrencyLabel")
-        if currency_labels:
-            currency_label = currency_labels.first()
-            balance_text = str(currency_label._label.renderable)
-            assert "£" in balance_text  # Should show currency symbol
-            assert balance_text != "£0.00"  # Should have actual data
+    # Should now show ready text again
+    ready_text = label_text(loading_label)
+    assert "Ready" in ready_text or "Up to date" in ready_text
 
 
-@pytest.mark.asyncio
-async def test_data_status_card_reactive_flow():
+async def test_balance_card_reactive_flow(shared_app):
+    """Test that BalanceCard properly reacts to data updates."""
+    app, pilot = shared_app
+
+    # Get the balance card and services
+    balance_card = app.query_one("#balance-card", BalanceCard)
+    app_state = get_app_state()
+    data_service = get_data_service()
+
+    # Wait for initial rendering
+    await pilot.pause()
+
+    # Check initial state - should show ready/not loading
+    loading_labels = balance_card.query("LoadingLabel")
+    if loading_labels:
+        loading_label = loading_labels.first()
+        initial_text = label_text(loading_label)
+        # Should not show loading initially
+        assert "Loading" not in initial_text and "Refreshing" not in initial_text
+
+    # Trigger a data refresh which should show loading state
+    await data_service.refresh_data()
+    await wait_until(
+        pilot, lambda: not any(is_loading(label) for label in loading_labels)
+    )
+
+    # After refresh, should show ready state
+    if loading_labels:
+        loading_label = loading_labels.first()
+        final_text = label_text(loading_label)
+        assert "Ready" in final_text or "Up to date" in final_text
+
+    # Check that balance was updated
+    currency_labels = balance_card.query("CurrencyLabel")
+    if currency_labels:
+        currency_label = currency_labels.first()
+        balance_text = label_text(currency_label)
+        assert "£" in balance_text  # Should show currency symbol
+        assert balance_text != "£0.00"  # Should have actual data
+
+
+async def test_data_status_card_reactive_flow(shared_app):
     """Test that DataStatusCard properly reacts to data updates."""
-    app = TestDataStatusCard()
+    app, pilot = shared_app
 
-    async with app.run_test() as pilot:
-        # Get the data status card and services
-        data_status_card = app.query_one("#data-status-card", DataStatusCard)
-        data_service = get_data_service()
+    # Get the data status card and services
+    data_status_card = app.query_one("#data-status-card", DataStatusCard)
+    data_service = get_data_service()
 
-        # Wait for initial rendering
-        await pilot.pause(0.1)
+    # Wait for initial rendering
+    await pilot.pause()
 
-        # Check initial state
-        loading_labels = data_status_card.query("LoadingLabel")
-        counter_labels = data_status_card.query("CounterLabel")
+    # Check initial state
+    loading_labels = data_status_card.query("LoadingLabel")
+    counter_labels = data_status_card.query("CounterLabel")
 
-        # Trigger a data refresh
-        await data_service.refresh_data()
-        await pilot.pause(0.1)  # Allow reactive updates
+    # Trigger a data refresh
+    await data_service.refresh_data()
+    await wait_until(
+        pilot, lambda: not any(is_loading(label) for label in loading_labels)
+    )
 
-        # After refresh, should show ready state
-        if loading_labels:
-            loading_label = loading_labels.first()
-            final_text = str(loading_label._label.renderable)
-            assert "Ready" in final_text or "✅" in final_text
+    # After refresh, should show ready state
+    if loading_labels:
+        loading_label = loading_labels.first()
+        final_text = label_text(loading_label)
+        assert "Ready" in final_text or "✅" in final_text
 
-        # Should show transaction count
-        if counter_labels:
-            counter_label = counter_labels.first()
-            count_text = str(counter_label._label.renderable)
-            assert "record" in count_text  # Should show some records
+    # Should show transaction count
+    if counter_labels:
+        counter_label = counter_labels.first()
+        count_text = label_text(counter_label)
+        assert "record" in count_text  # Should show some records
 
 
-@pytest.mark.asyncio
-async def test_multiple_widgets_sync():
+async def test_multiple_widgets_sync(shared_app):
     """Test that multiple widgets stay synchronized during data updates."""
-    app = TestMultipleWidgets()
+    app, pilot = shared_app
 
-    async with app.run_test() as pilot:
-        # Get all the widgets
-        balance_card = app.query_one("#balance-card", BalanceCard)
-        data_status_card = app.query_one("#data-status-card", DataStatusCard)
-        standalone_loading = app.query_one("#standalone-loading", LoadingLabel)
+    # Get all the widgets
+    balance_card = app.query_one("#balance-card", BalanceCard)
+    data_status_card = app.query_one("#data-status-card", DataStatusCard)
+    standalone_loading = app.query_one("#standalone-loading", LoadingLabel)
 
-        data_service = get_data_service()
-        app_state = get_app_state()
+    data_service = get_data_service()
+    app_state = get_app_state()
 
-        # Wait for initial rendering
-        await pilot.pause(0.1)
+    # Wait for initial rendering
+    await pilot.pause()
 
-        # Test that setting loading state affects all widgets
-        app_state.update_loading_state(True)
-        await pilot.pause(0.1)
+    # Test that setting loading state affects all widgets
+    app_state.update_loading_state(True)
+    await wait_until(pilot, lambda: is_loading(standalone_loading))
 
-        # Check that standalone loading widget shows loading
-        loading_text = str(standalone_loading._label.renderable)
-        assert "Loading" in loading_text or "Refreshing" in loading_text
+    # Check that standalone loading widget shows loading
+    loading_text = label_text(standalone_loading)
+    assert "Loading" in loading_text or "Refreshing" in loading_text
 
-        # Test that data refresh affects all widgets
-        await data_service.refresh_data()
-        await pilot.pause(0.1)
+    # Test that data refresh affects all widgets
+    await data_service.refresh_data()
+    loading_widgets = app.query("LoadingLabel")
+    await wait_until(
+        pilot, lambda: not any(is_loading(label) for label in loading_widgets)
+    )
 
-        # All loading widgets should now show ready
-        loading_widgets = app.query("LoadingLabel")
-        for widget in loading_widgets:
-            widget_text = str(widget._label.renderable)
-            # Should not be loading anymore
-            assert "Loading" not in widget_text and "Refreshing" not in widget_text
+    # All loading widgets should now show ready
+    for widget in loading_widgets:
+        widget_text = label_text(widget)
+        # Should not be loading anymore
+        assert "Loading" not in widget_text and "Refreshing" not in widget_text
 
 
-@pytest.mark.asyncio
-async def test_loading_state_transitions():
+async def test_loading_state_transitions(shared_app):
     """Test the complete loading state transition cycle."""
-    app = TestLoadingWidget()
+    app, pilot = shared_app
 
-    async with app.run_test() as pilot:
-        loading_label = app.query_one("#loading-label", LoadingLabel)
-        app_state = get_app_state()
-        event_bus = get_event_bus()
+    loading_label = app.query_one("#standalone-loading", LoadingLabel)
+    app_state = get_app_state()
+    event_bus = get_event_bus()
 
-        # Track state changes
-        states_seen = []
+    # Track state changes
+    states_seen = []
 
-        def track_state():
-            current_text = str(loading_label._label.renderable)
-            states_seen.append(current_text)
+    def track_state():
+        current_text = label_text(loading_label)
+        states_seen.append(current_text)
 
-        await pilot.pause(0.1)
-        track_state()  # Initial state
+    await pilot.pause()
+    track_state()  # Initial state
 
-        # Simulate the complete loading cycle
-        app_state.update_loading_state(True)
-        await pilot.pause(0.1)
-        track_state()  # Loading state
+    # Simulate the complete loading cycle
+    app_state.update_loading_state(True)
+    await wait_until(pilot, lambda: is_loading(loading_label))
+    track_state()  # Loading state
 
-        app_state.update_loading_state(False)
-        await pilot.pause(0.1)
-        track_state()  # Ready state
+    app_state.update_loading_state(False)
+    await wait_until(pilot, lambda: not is_loading(loading_label))
+    track_state()  # Ready state
 
-        # Verify we saw the transition
-        assert len(states_seen) == 3
+    # Verify we saw the transition
+    assert len(states_seen) == 3
 
-        # First state should be ready/idle
-        initial_state = states_seen[0]
-        assert "Loading" not in initial_state and "Refreshing" not in initial_state
+    # First state should be ready/idle
+    initial_state = states_seen[0]
+    assert "Loading" not in initial_state and "Refreshing" not in initial_state
 
-        # Middle state should be loading
-        loading_state = states_seen[1]
-        assert "Loading" in loading_state or "Refreshing" in loading_state
+    # Middle state should be loading
+    loading_state = states_seen[1]
+    assert "Loading" in loading_state or "Refreshing" in loading_state
 
-        # Final state should be ready again
-        final_state = states_seen[2]
-        assert "Loading" not in final_state and "Refreshing" not in final_state
+    # Final state should be ready again
+    final_state = states_seen[2]
+    assert "Loading" not in final_state and "Refreshing" not in final_state
 
 
-@pytest.mark.asyncio
-async def test_data_service_integration():
+async def test_data_service_integration(shared_app):
     """Test that DataService loading states properly propagate to widgets."""
-    app = TestBalanceCard()
+    app, pilot = shared_app
 
-    async with app.run_test() as pilot:
-        balance_card = app.query_one("#balance-card", BalanceCard)
-        data_service = get_data_service()
+    balance_card = app.query_one("#balance-card", BalanceCard)
+    data_service = get_data_service()
+
+    await pilot.pause()
 
-        await pilot.pause(0.1)
+    # Get initial balance
+    currency_labels = balance_card.query("CurrencyLabel")
+    if currency_labels:
+        currency_label = currency_labels.first()
+        initial_balance = label_text(currency_label)
+
+    # Refresh data multiple times to ensure consistency
+    loading_labels = balance_card.query("LoadingLabel")
+    for _ in range(3):
+        await data_service.refresh_data()
+        await wait_until(
+            pilot, lambda: not any(is_loading(label) for label in loading_labels)
+        )
 
-        # Get initial balance
-        currency_labels = balance_card.query("CurrencyLabel")
+        # Check that balance updates each time
         if currency_labels:
-            currency_label = currency_labels.first()
-            initial_balance = str(currency_label._label.renderable)
-
-        # Refresh data multiple times to ensure consistency
-        for i in range(3):
-            await data_service.refresh_data()
-            await pilot.pause(0.1)
-
-            # Check that balance updates each time
-            if currency_labels:
-                current_balance = str(currency_label._label.renderable)
-                assert "£" in current_balance
-                # Balance should be non-zero after refresh
-                assert current_balance != "£0.00"
-
-            # Check that loading state completes
-            loading_labels = balance_card.query("LoadingLabel")
-            if loading_labels:
-                loading_label = loading_labels.first()
-                loading_text = str(loading_label._label.renderable)
-                assert (
-                    "Loading" not in loading_text and "Refreshing" not in loading_text
-                )
-
-
-@pytest.mark.asyncio
-async def test_error_state_handling():
+            current_balance = label_text(currency_label)
+            assert "£" in current_balance
+            # Balance should be non-zero after refresh
+            assert current_balance != "£0.00"
+
+        # Check that loading state completes
+        if loading_labels:
+            loading_label = loading_labels.first()
+            loading_text = label_text(loading_label)
+            assert "Loading" not in loading_text and "Refreshing" not in loading_text
+
+
+async def test_error_state_handling(shared_app):
     """Test that widgets properly handle error states."""
-    app = TestDataStatusCard()
+    app, pilot = shared_app
+
+    data_status_card = app.query_one("#data-status-card", DataStatusCard)
+    app_state = get_app_state()
+
+    await pilot.pause()
 
+    # Simulate an error state
+    app_state.update_error_state("Test error message")
+    await pilot.pause()
+
+    # Check that error is handled gracefully
+    # (The widgets should not crash and should show non-loading state)
+    loading_labels = data_status_card.query("LoadingLabel")
+    if loading_labels:
+        loading_label = loading_labels.first()
+        loading_text = label_text(loading_label)
+        # Should not be stuck in loading state due to error
+        assert "Loading" not in loading_text and "Refreshing" not in loading_text
+
+    # Clear error state
+    app_state.update_error_state(None)
+    await pilot.pause()
+
+
+async def test_nested_batched_updates_refresh_once():
+    """Refreshes requested inside nested batches run once, after the outer one."""
+    app = RefreshCountingApp()
+    async with app.run_test() as pilot:
+        widget = app.query_one(RefreshCountingWidget)
+        await pilot.pause()
+        widget.refreshes = 0
+
+        with widget.batched_updates():
+            widget._schedule_refresh()
+            with widget.batched_updates():
+                widget._schedule_refresh()
+                widget._schedule_refresh()
+            # Leaving the inner batch must not refresh yet
+            assert widget.refreshes == 0
+            widget._schedule_refresh()
+            assert widget.refreshes == 0
+
+        # The outer batch schedules one refresh rather than running it
+        assert widget.refreshes == 0
+        assert widget._pending_refresh is not None
+        await pilot.pause(widget.REFRESH_DELAY * 2)
+        assert widget.refreshes == 1
+
+
+async def test_events_delivered_together_refresh_once():
+    """Events flushed together, or in quick succession, share a single refresh."""
+    app = RefreshCountingApp()
     async with app.run_test() as pilot:
-        data_status_card = app.query_one("#data-status-card", DataStatusCard)
-        app_state = get_app_state()
+        widget = app.query_one(RefreshCountingWidget)
+        await pilot.pause()
+        widget.refreshes = 0
 
-        await pilot.pause(0.1)
+        event_bus = get_event_bus()
+        event_bus.emit_simple(EventType.DATA_UPDATED, source="test")
+        event_bus.emit_simple(EventType.EXCLUSIONS_CHANGED, source="test")
+        await wait_until(pilot, lambda: not widget._pending_events)
 
-        # Simulate an error state
-        app_state.update_error_state("Test error message")
-        await pilot.pause(0.1)
+        # The flush schedules a debounced refresh instead of running one
+        assert widget.refreshes == 0
+        assert widget._pending_refresh is not None
 
-        # Check that error is handled gracefully
-        # (The widgets should not crash and should show non-loading state)
-        loading_labels = data_status_card.query("LoadingLabel")
-        if loading_labels:
-            loading_label = loading_labels.first()
-            loading_text = str(loading_label._label.renderable)
-            # Should not be stuck in loading state due to error
-            assert "Loading" not in loading_text and "Refreshing" not in loading_text
+        # A separate flush within REFRESH_DELAY joins the same refresh
+        event_bus.emit_simple(EventType.DATA_UPDATED, source="test")
+        await wait_until(pilot, lambda: not widget._pending_events)
+        assert widget.refreshes == 0
+
+        await pilot.pause(widget.REFRESH_DELAY * 2)
+        assert widget.refreshes == 1
+
+
+async def test_coordinator_refreshes_each_dirty_widget_once():
+    """Widgets marked dirty several times in one tick are each queried once."""
+    app = CoordinatedApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        widgets = list(app.screen.query(DataWidget))
+        calls: dict[str, int] = {}
+        for widget in widgets:
+            widget._query_func = counting_query(calls, widget.id)
+
+        for _ in range(3):
+            for widget in widgets:
+                widget.refresh_data()
+        await wait_until(pilot, lambda: all(widget.data for widget in widgets))
+        await pilot.pause()
+
+        assert calls == {"first": 1, "second": 1, "third": 1}
+        assert [widget.data for widget in widgets] == [
+            ["first"],
+            ["second"],
+            ["third"],
+        ]
+        assert not any(widget.is_loading for widget in widgets)
+
+
+async def test_coordinator_skips_removed_widget():
+    """A widget removed before the coordinator runs is skipped without error."""
+    app = CoordinatedApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        coordinator = app.screen.refresh_coordinator
+        removed = app.screen.query_one("#first", DataWidget)
+        kept = app.screen.query_one("#second", DataWidget)
+        calls: dict[str, int] = {}
+        removed._query_func = counting_query(calls, "first")
+        kept._query_func = counting_query(calls, "second")
+
+        await removed.remove()
+        coordinator.mark_dirty(removed)
+        coordinator.mark_dirty(kept)
+        await wait_until(pilot, lambda: bool(kept.data))
+
+        assert calls == {"second": 1}
+        assert removed.data == []
+        assert removed.error_message is None
+
+
+async def test_coordinator_survives_query_errors(caplog):
+    """A failing query is logged and the coordinator keeps serving refreshes."""
+    app = CoordinatedApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        coordinator = app.screen.refresh_coordinator
+        failing = app.screen.query_one("#first", DataWidget)
+        healthy = app.screen.query_one("#second", DataWidget)
+        calls: dict[str, int] = {}
+        failing._query_func = counting_query(calls, "first", fail=True)
+        healthy._query_func = counting_query(calls, "second")
+
+        coordinator.mark_dirty(failing)
+        coordinator.mark_dirty(healthy)
+        await wait_until(pilot, lambda: bool(healthy.data))
+
+        assert failing.error_message == "first failed"
+        assert "first failed" in caplog.text
+
+        # The loop is still running and picks up the next refresh
+        failing._query_func = counting_query(calls, "first")
+        coordinator.mark_dirty(failing)
+        await wait_until(pilot, lambda: bool(failing.data))
 
-        # Clear error state
-        app_state.update_error_state(None)
-        await pilot.pause(0.1)
+        assert calls == {"first": 2, "second": 1}
+        assert failing.data == ["first"]
 
 
 if __name__ == "__main__":
     # Run tests directly if script is executed
-    pytest.main([__file__, "-v", "--asyncio-mode=auto"])
+    pytest.main([__file__, "-v"])
@@ -1,10 +1,46 @@
 """Helper utility functions for the Monzo app v2."""
 
 import logging
+import math
+import re
+import time
+from collections.abc import Callable
 from datetime import datetime
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+_FILE_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_DEFAULT_TRUNCATE_AT = 30 - len("...")
+_STARS = "*" * 64
+
+# Every bar generate_bar_chart can return with its default arguments
+_BAR_FILLED = "█"
+_BAR_EMPTY = "░"
+_BAR_WIDTH = 20
+_BARS = tuple(
+    _BAR_FILLED * filled + _BAR_EMPTY * (_BAR_WIDTH - filled)
+    for filled in range(_BAR_WIDTH + 1)
+)
+
+# Position between a lowercase and an uppercase letter
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<=[a-z])(?=[A-Z])")
+# Currency symbols and thousands separators
+_CURRENCY_CHARS_RE = re.compile(r"[£$€¥,]")
+
+
+@lru_cache(maxsize=32)
+def _currency_formatter(currency_symbol: str, decimal_places: int) -> Callable:
+    """Return a cached str.format for the given symbol and precision."""
+    symbol = currency_symbol.replace("{", "{{").replace("}", "}}")
+    return f"{symbol}{{:,.{decimal_places}f}}".format
+
+
+@lru_cache(maxsize=8)
+def _percentage_formatter(decimal_places: int) -> Callable:
+    """Return a cached str.format for the given precision."""
+    return f"{{:.{decimal_places}f}}%".format
+
 
 def format_currency(
     amount: float, currency_symbol: str = "£", decimal_places: int = 2
@@ -20,7 +56,7 @@ def format_currency(
         Formatted currency string
     """
     try:
-        return f"{currency_symbol}{amount:,.{decimal_places}f}"
+        return _currency_formatter(currency_symbol, decimal_places)(amount)
     except (ValueError, TypeError):
         return f"{currency_symbol}0.00"
 
@@ -36,7 +72,7 @@ def format_percentage(value: float, decimal_places: int = 1) -> str:
         Formatted percentage string
     """
     try:
-        return f"{value * 100:.{decimal_places}f}%"
+        return _percentage_formatter(decimal_places)(value * 100)
     except (ValueError, TypeError):
         return "0.0%"
 
@@ -74,12 +110,16 @@ def truncate_text(text: str, max_length: int = 30, suffix: str = "...") -> str:
     Returns:
         Truncated text string
     """
-    if not isinstance(text, str):
+    if type(text) is not str:
         text = str(text)
 
     if len(text) <= max_length:
         return text
 
+    # Common default: truncate to 27 characters plus "..."
+    if max_length == 30 and suffix == "...":
+        return text[:_DEFAULT_TRUNCATE_AT] + "..."
+
     return text[: max_length - len(suffix)] + suffix
 
 
@@ -94,9 +134,9 @@ def safe_divide(numerator: float, denominator: float, fallback: float = 0.0) ->
     Returns:
         Division result or fallback
     """
+    if denominator == 0:
+        return fallback
     try:
-        if denominator == 0:
-            return fallback
         return numerator / denominator
     except (TypeError, ValueError):
         return fallback
@@ -114,11 +154,22 @@ def clamp(value: float, min_value: float, max_value: float) -> float:
         Clamped value
     """
     try:
-        return max(min_value, min(max_value, value))
+        return _clamp(value, min_value, max_value)
     except (TypeError, ValueError):
         return min_value
 
 
+def _clamp(value: float, min_value: float, max_value: float) -> float:
+    """Clamp trusted numeric input without the exception handling of clamp()."""
+    return max(min_value, min(max_value, value))
+
+
+@lru_cache(maxsize=128)
+def _plural_form(singular: str, plural: str | None) -> str:
+    """Return the plural form, defaulting to singular + 's'."""
+    return singular + "s" if plural is None else plural
+
+
 def pluralize(count: int, singular: str, plural: str | None = None) -> str:
     """Return the correct plural form based on count.
 
@@ -130,10 +181,7 @@ def pluralize(count: int, singular: str, plural: str | None = None) -> str:
     Returns:
         Correct form of the word
     """
-    if plural is None:
-        plural = singular + "s"
-
-    return singular if count == 1 else plural
+    return singular if count == 1 else _plural_form(singular, plural)
 
 
 def format_count(count: int, singular: str, plural: str | None = None) -> str:
@@ -147,8 +195,7 @@ def format_count(count: int, singular: str, plural: str | None = None) -> str:
     Returns:
         Formatted count string (e.g., "1 item", "5 items")
     """
-    word = pluralize(count, singular, plural)
-    return f"{count:,} {word}"
+    return f"{count:,} {pluralize(count, singular, plural)}"
 
 
 def generate_bar_chart(
@@ -170,21 +217,33 @@ def generate_bar_chart(
     Returns:
         ASCII bar chart string
     """
+    if width == _BAR_WIDTH and filled_char == _BAR_FILLED and empty_char == _BAR_EMPTY:
+        if max_value <= 0:
+            return _BARS[0]
+        ratio = value / max_value
+        if ratio <= 0:
+            return _BARS[0]
+        if not ratio < 1:  # Also catches NaN, matching clamp()
+            return _BARS[_BAR_WIDTH]
+        return _BARS[int(ratio * _BAR_WIDTH)]
+
     if max_value <= 0:
         return empty_char * width
 
-    ratio = clamp(value / max_value, 0.0, 1.0)
+    ratio = _clamp(value / max_value, 0.0, 1.0)
     filled_width = int(ratio * width)
     empty_width = width - filled_width
 
     return filled_char * filled_width + empty_char * empty_width
 
 
-def format_time_ago(timestamp: datetime) -> str:
+def format_time_ago(timestamp: datetime | float, now: float | None = None) -> str:
     """Format a timestamp as "time ago" string.
 
     Args:
-        timestamp: The timestamp to format
+        timestamp: The timestamp to format, as a datetime or epoch seconds
+        now: Current epoch seconds, so callers formatting many labels can
+            share one clock read (default: time.time())
 
     Returns:
         Human-readable time ago string
@@ -193,24 +252,23 @@ def format_time_ago(timestamp: datetime) -> str:
         return "Never"
 
     try:
-        now = datetime.now()
-        diff = now - timestamp
-
-        seconds = diff.total_seconds()
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.timestamp()
+        seconds = int((time.time() if now is None else now) - timestamp)
 
         if seconds < 60:
-            return f"{int(seconds)} seconds ago"
+            return f"{seconds} seconds ago"
         elif seconds < 3600:
-            minutes = int(seconds / 60)
+            minutes = seconds // 60
             return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
         elif seconds < 86400:
-            hours = int(seconds / 3600)
+            hours = seconds // 3600
             return f"{hours} hour{'s' if hours != 1 else ''} ago"
         else:
-            days = int(seconds / 86400)
+            days = seconds // 86400
             return f"{days} day{'s' if days != 1 else ''} ago"
 
-    except (AttributeError, TypeError):
+    except (AttributeError, TypeError, ValueError, OverflowError):
         return "Unknown"
 
 
@@ -238,11 +296,8 @@ def camel_to_title(camel_string: str) -> str:
     Returns:
         String in Title Case format
     """
-    import re
-
     # Insert space before uppercase letters
-    result = re.sub(r"(?<=[a-z])(?=[A-Z])", " ", camel_string)
-    return result.title()
+    return _CAMEL_BOUNDARY_RE.sub(" ", camel_string).title()
 
 
 def snake_to_title(snake_string: str) -> str:
@@ -267,11 +322,14 @@ def format_file_size(size_bytes: int) -> str:
         Human-readable size string
     """
     try:
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} PB"
+        if size_bytes < 1024:
+            return f"{size_bytes:.1f} B"
+        # Each unit is 2**10 times the last, so the bit length picks the unit;
+        # inf and nan have no bit length and fall through to the largest unit
+        unit = len(_FILE_SIZE_UNITS) - 1
+        if math.isfinite(size_bytes):
+            unit = min(unit, (int(size_bytes).bit_length() - 1) // 10)
+        return f"{size_bytes / (1 << 10 * unit):.1f} {_FILE_SIZE_UNITS[unit]}"
     except (TypeError, ValueError):
         return "0 B"
 
@@ -287,9 +345,7 @@ def parse_currency(currency_string: str) -> float:
     """
     try:
         # Remove currency symbols and commas
-        import re
-
-        cleaned = re.sub(r"[£$€¥,]", "", currency_string)
+        cleaned = _CURRENCY_CHARS_RE.sub("", currency_string)
         return float(cleaned)
     except (ValueError, TypeError):
         return 0.0
@@ -310,4 +366,8 @@ def mask_sensitive_data(data: str, visible_chars: int = 4, mask_char: str = "*")
         return data
 
     mask_length = len(data) - visible_chars
-    return mask_char * mask_length + data[-visible_chars:]
+    if mask_char == "*" and mask_length <= len(_STARS):
+        mask = _STARS[:mask_length]
+    else:
+        mask = mask_char * mask_length
+    return mask + data[-visible_chars:]
@@ -1,15 +1,24 @@
 """Base widget classes for reactive behavior."""
 
+import asyncio
+import inspect
 import logging
+import weakref
 from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from core import AppEvent
 from core import EventType
 from core import get_app_state
+from core import get_data_service
 from core import get_event_bus
+from textual import work
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
+from textual.worker import get_current_worker
 
 logger = logging.getLogger(__name__)
 
@@ -20,14 +29,17 @@ class ReactiveWidget(Widget):
     # Reactive properties for event management
     _is_mounted: reactive[bool] = reactive(False)
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._event_bus = get_event_bus()
+        # Keyed by (event type, callback) so repeat subscriptions are ignored
+        self._subscriptions: dict[
+            tuple[EventType, Callable], tuple[EventType, Callable]
+        ] = {}
+        self._pending_events: dict[Callable, AppEvent] = {}
+
     def on_mount(self) -> None:
         """Called when widget is mounted."""
-        # Initialize event system if not already done
-        if not hasattr(self, "_event_bus"):
-            self._event_bus = get_event_bus()
-        if not hasattr(self, "_subscriptions"):
-            self._subscriptions = []
-
         self._is_mounted = True
         self.setup_subscriptions()
         logger.debug(f"{self.__class__.__name__} mounted")
@@ -43,16 +55,73 @@ class ReactiveWidget(Widget):
 
     def cleanup_subscriptions(self) -> None:
         """Clean up event subscriptions."""
-        for event_type, callback in self._subscriptions:
-            self._event_bus.unsubscribe(event_type, callback)
+        self._event_bus.unsubscribe_many(self._subscriptions.values())
         self._subscriptions.clear()
+        self._pending_events.clear()
 
     def subscribe(
         self, event_type: EventType, callback: Callable[[AppEvent], None]
     ) -> None:
-        """Subscribe to an event type."""
-        self._event_bus.subscribe(event_type, callback)
-        self._subscriptions.append((event_type, callback))
+        """Subscribe to an event type.
+
+        Events are delivered after the next refresh, and a callback hit several
+        times before then only sees the latest event.
+        """
+        key = (event_type, callback)
+        if key in self._subscriptions:
+            return
+        dispatcher = self._make_dispatcher(event_type, callback)
+        self._event_bus.subscribe(event_type, dispatcher)
+        self._subscriptions[key] = (event_type, dispatcher)
+
+    def _make_dispatcher(
+        self, event_type: EventType, callback: Callable[[AppEvent], None]
+    ) -> Callable[[AppEvent], None]:
+        """Build a bus callback that only holds weak references to this widget.
+
+        If cleanup is skipped, the event bus can't keep the widget alive; once
+        it has been collected the dispatcher unsubscribes itself.
+        """
+        widget_ref = weakref.ref(self)
+        if inspect.ismethod(callback):
+            callback_ref = weakref.WeakMethod(callback)
+        else:
+
+            def callback_ref() -> Callable[[AppEvent], None]:
+                return callback
+
+        event_bus = self._event_bus
+
+        def dispatcher(event: AppEvent) -> None:
+            widget = widget_ref()
+            target = callback_ref()
+            if widget is None or target is None:
+                event_bus.unsubscribe(event_type, dispatcher)
+                return
+            widget._queue_event(target, event)
+
+        return dispatcher
+
+    def _queue_event(
+        self, callback: Callable[[AppEvent], None], event: AppEvent
+    ) -> None:
+        """Queue an event for the callback until the next flush."""
+        if not self._pending_events:
+            self.call_after_refresh(self._flush_pending_events)
+        # Re-insert so callbacks run in the order of their latest event
+        self._pending_events.pop(callback, None)
+        self._pending_events[callback] = event
+
+    def _flush_pending_events(self) -> None:
+        """Deliver queued events, one per callback."""
+        pending, self._pending_events = self._pending_events, {}
+        if not self._is_mounted:
+            return
+        for callback, event in pending.items():
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"{self.__class__.__name__}: Error handling {event}: {e}")
 
     def emit(self, event_type: EventType, data: Any = None) -> None:
         """Emit an event."""
@@ -69,12 +138,20 @@ class ReactiveWidget(Widget):
 class StateAwareWidget(ReactiveWidget):
     """Widget that automatically syncs with application state."""
 
+    # Seconds to wait for a burst of refresh requests to settle
+    REFRESH_DELAY = 0.1
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._app_state = get_app_state()
+        self._data_service = get_data_service()
+        self._pending_refresh: Timer | None = None
+        # Nesting depth of batched_updates() and whether a refresh was deferred
+        self._batch_depth = 0
+        self._batch_dirty = False
+
     def setup_subscriptions(self) -> None:
         """Set up standard state subscriptions."""
-        # Initialize app state if not already done
-        if not hasattr(self, "_app_state"):
-            self._app_state = get_app_state()
-
         super().setup_subscriptions()
 
         # Subscribe to key state changes
@@ -103,6 +180,47 @@ class StateAwareWidget(ReactiveWidget):
     def on_app_ready(self, event: AppEvent) -> None:
         """Handle app ready events. Override in subclasses."""
 
+    @contextmanager
+    def batched_updates(self) -> Iterator[None]:
+        """Defer content refreshes until the outermost batch exits.
+
+        Refreshes requested inside the block collapse into a single scheduled
+        refresh when it ends, still debounced by REFRESH_DELAY. Batches may be
+        nested.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self._schedule_refresh()
+
+    def _flush_pending_events(self) -> None:
+        """Deliver queued events, scheduling at most one refresh for all of them."""
+        with self.batched_updates():
+            super()._flush_pending_events()
+
+    def _schedule_refresh(self) -> None:
+        """Refresh content once no further requests arrive for REFRESH_DELAY."""
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        if self._pending_refresh is not None:
+            self._pending_refresh.stop()
+        self._pending_refresh = self.set_timer(self.REFRESH_DELAY, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        """Run the scheduled content refresh."""
+        if self._pending_refresh is not None:
+            self._pending_refresh.stop()
+            self._pending_refresh = None
+        self._refresh_content()
+
+    def _refresh_content(self) -> None:
+        """Recompute displayed content. Override in subclasses."""
+
     @property
     def app_state(self):
         """Get the application state."""
@@ -118,45 +236,93 @@ class DataWidget(StateAwareWidget):
     error_message: reactive[str | None] = reactive(None)
     last_updated: reactive[str | None] = reactive(None)
 
-    def on_mount(self) -> None:
-        """Called when widget is mounted."""
-        super().on_mount()
-        if not hasattr(self, "_query_func"):
-            self._query_func: Callable | None = None
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._query_func: Callable | None = None
+        self._last_refresh_key: Any = None
 
     def set_query_function(self, func: Callable) -> None:
         """Set the function used to query data."""
         self._query_func = func
+        self._last_refresh_key = None
         if self.is_mounted:
             self.refresh_data()
 
     def refresh_data(self) -> None:
-        """Refresh widget data using the query function."""
+        """Refresh widget data by running the query function in a worker."""
         if not self._query_func:
             logger.warning(f"{self.__class__.__name__}: No query function set")
             return
 
-        try:
-            self.is_loading = True
-            self.error_message = None
+        # Skip the query when nothing it depends on has changed
+        key = self._refresh_key()
+        if key is not None and key == self._last_refresh_key:
+            return
+        self._last_refresh_key = key
+
+        self.is_loading = True
+        self.error_message = None
+
+        # Let the screen's coordinator batch this with other widgets' queries
+        coordinator = getattr(self.screen, "refresh_coordinator", None)
+        if coordinator is not None:
+            coordinator.mark_dirty(self)
+        else:
+            self._run_query(self._query_func)
 
-            # Execute query function
-            result = self._query_func()
-            self.data = result if isinstance(result, list) else []
+    def _refresh_key(self) -> Any:
+        """Return a fingerprint of the query inputs, or None to always refresh."""
+        return None
+
+    @work(thread=True, exclusive=True, group="query")
+    def _run_query(self, query_func: Callable) -> None:
+        """Execute the query function off the UI thread."""
+        try:
+            result = query_func()
+        except Exception as e:
+            # A newer refresh has replaced this one and owns the loading state
+            if not get_current_worker().is_cancelled:
+                self.app.call_from_thread(self._apply_error, e)
+            return
 
-            self.is_loading = False
-            self.last_updated = "Just now"
-            logger.debug(
-                f"{self.__class__.__name__}: Data refreshed, {len(self.data)} items"
-            )
+        # A newer refresh has replaced this one
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._apply_result, result)
 
+    async def _run_query_async(self) -> None:
+        """Execute the query function in a thread and apply its result."""
+        try:
+            result = await asyncio.to_thread(self._query_func)
         except Exception as e:
-            self.is_loading = False
-            self.error_message = str(e)
-            logger.error(f"{self.__class__.__name__}: Error refreshing data: {e}")
+            if self.is_attached:
+                self._apply_error(e)
+            return
+
+        if self.is_attached:
+            self._apply_result(result)
+
+    def _apply_result(self, result: Any) -> None:
+        """Store a query result on the UI thread."""
+        self.data = result if isinstance(result, list) else []
+        self.is_loading = False
+        self.last_updated = "Just now"
+        logger.debug(
+            f"{self.__class__.__name__}: Data refreshed, {len(self.data)} items"
+        )
+
+    def _apply_error(self, error: Exception) -> None:
+        """Record a query failure on the UI thread."""
+        self._last_refresh_key = None
+        self.is_loading = False
+        self.error_message = str(error)
+        logger.error(f"{self.__class__.__name__}: Error refreshing data: {error}")
 
     def on_data_updated(self, event: AppEvent) -> None:
         """Refresh data when global data is updated."""
+        self._schedule_refresh()
+
+    def _refresh_content(self) -> None:
+        """Re-run the query function."""
         self.refresh_data()
 
     def watch_data(self, data: list) -> None:
@@ -169,3 +335,40 @@ class DataWidget(StateAwareWidget):
         """React to error changes. Override in subclasses."""
         if error:
             logger.error(f"{self.__class__.__name__}: {error}")
+
+
+class RefreshCoordinator:
+    """Service DataWidget refreshes for a screen from a single task.
+
+    Widgets that need new data are marked dirty; the run() loop drains the
+    dirty set and queries each widget in turn, so a burst of events touching
+    several widgets costs one pass rather than one worker per widget.
+    """
+
+    def __init__(self) -> None:
+        # Insertion-ordered set of widgets waiting for a query
+        self._dirty: dict[DataWidget, None] = {}
+        self._dirty_event = asyncio.Event()
+
+    def mark_dirty(self, widget: DataWidget) -> None:
+        """Queue a widget for its next query."""
+        self._dirty[widget] = None
+        self._dirty_event.set()
+
+    async def run(self) -> None:
+        """Query dirty widgets until cancelled."""
+        while True:
+            await self._dirty_event.wait()
+            self._dirty_event.clear()
+            dirty, self._dirty = self._dirty, {}
+            for widget in dirty:
+                if not widget.is_attached:
+                    continue
+                try:
+                    await widget._run_query_async()
+                except Exception as e:
+                    logger.error(
+                        "RefreshCoordinator: Error refreshing %s: %s",
+                        widget.__class__.__name__,
+                        e,
+                    )
@@ -23,21 +23,21 @@ class BalanceCard(StateAwareWidget):
         """Compose the balance card widget."""
         with Container(classes="balance-card"):
             yield Label("Account Balance", classes="balance-title")
-            balance_label = CurrencyLabel(classes="balance-amount")
-            balance_label.state_key = "balance"
-            balance_label.currency_symbol = "£"
-            yield balance_label
+            yield CurrencyLabel(
+                state_key="balance", currency_symbol="£", classes="balance-amount"
+            )
 
             with Vertical(classes="balance-info"):
-                loading_label = LoadingLabel(classes="balance-status")
-                loading_label.loading_text = "Refreshing..."
-                loading_label.idle_text = "Up to date"
-                yield loading_label
-
-                time_label = TimeLabel(classes="balance-updated")
-                time_label.state_key = "data_last_updated"
-                time_label.prefix = "Last updated: "
-                yield time_label
+                yield LoadingLabel(
+                    loading_text="Refreshing...",
+                    idle_text="Up to date",
+                    classes="balance-status",
+                )
+                yield TimeLabel(
+                    state_key="data_last_updated",
+                    prefix="Last updated: ",
+                    classes="balance-updated",
+                )
 
     def on_mount(self) -> None:
         """Called when widget is mounted."""
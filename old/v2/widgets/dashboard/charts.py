@@ -1,14 +1,16 @@
 """Chart widgets for displaying spending data and trends."""
 
 import logging
+from typing import Any
 
 from core import AppEvent
-from core import get_data_service
 from textual.app import ComposeResult
 from textual.containers import Container
+from textual.containers import Grid
 from textual.containers import Horizontal
 from textual.containers import Vertical
 from textual.widgets import Label
+from utils.helpers import generate_bar_chart
 
 from widgets.base import StateAwareWidget
 from widgets.reactive_label import CounterLabel
@@ -33,30 +35,28 @@ class MonthlySpendChart(StateAwareWidget):
                     "(Reactive data updates shown below)", classes="chart-subtitle"
                 )
 
-            # Reactive data display
-            with Vertical(classes="chart-data"):
-                with Horizontal():
-                    yield Label("Current Month:", classes="data-label")
-                    monthly_label = CurrencyLabel(classes="data-value")
-                    monthly_label.state_key = "monthly_spend"
-                    monthly_label.currency_symbol = "£"
-                    yield monthly_label
+            # Reactive data display, one label/value pair per grid row
+            with Grid(classes="chart-data"):
+                yield Label("Current Month:", classes="data-label")
+                yield CurrencyLabel(
+                    state_key="monthly_spend", currency_symbol="£", classes="data-value"
+                )
 
-                with Horizontal():
-                    yield Label("Exclusions Applied:", classes="data-label")
-                    exclusions_label = CounterLabel(classes="data-value")
-                    exclusions_label.state_key = "exclusions"
-                    exclusions_label.singular = "category"
-                    exclusions_label.plural = "categories"
-                    yield exclusions_label
+                yield Label("Exclusions Applied:", classes="data-label")
+                yield CounterLabel(
+                    state_key="exclusions",
+                    singular="category",
+                    plural="categories",
+                    classes="data-value",
+                )
 
-                with Horizontal():
-                    yield Label("Data Points:", classes="data-label")
-                    transactions_label = CounterLabel(classes="data-value")
-                    transactions_label.state_key = "transaction_count"
-                    transactions_label.singular = "transaction"
-                    transactions_label.plural = "transactions"
-                    yield transactions_label
+                yield Label("Data Points:", classes="data-label")
+                yield CounterLabel(
+                    state_key="transaction_count",
+                    singular="transaction",
+                    plural="transactions",
+                    classes="data-value",
+                )
 
     def on_mount(self) -> None:
         """Called when widget is mounted."""
@@ -73,20 +73,19 @@ class MonthlySpendChart(StateAwareWidget):
         """Handle exclusions change events."""
         logger.debug("MonthlySpendChart: Exclusions changed")
         # Simulate chart recalculation with exclusions
-        data_service = get_data_service()
+        data_service = self._data_service
         if event.data and "exclusions" in event.data:
             exclusions = event.data["exclusions"]
-            logger.info(f"Chart recalculating with {len(exclusions)} exclusions")
+            logger.info("Chart recalculating with %d exclusions", len(exclusions))
 
 
 class SpendingComparisonChart(StateAwareWidget):
     """Widget displaying spending comparison across categories."""
 
-    def on_mount(self) -> None:
-        """Called when widget is mounted."""
-        super().on_mount()
-        if not hasattr(self, "_comparison_data"):
-            self._comparison_data = []
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (data version, exclusions) behind the categories currently shown
+        self._last_categories_key: tuple | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the spending comparison chart widget."""
@@ -99,7 +98,10 @@ class SpendingComparisonChart(StateAwareWidget):
                 yield Label("(Top spending categories)", classes="chart-subtitle")
 
             # Dynamic category display
-            with Vertical(classes="category-list", id="category-container"):
+            self._category_container = Vertical(
+                classes="category-list", id="category-container"
+            )
+            with self._category_container:
                 yield Label("Loading categories...", classes="loading-text")
 
     def on_mount(self) -> None:
@@ -112,45 +114,59 @@ class SpendingComparisonChart(StateAwareWidget):
     def on_data_updated(self, event: AppEvent) -> None:
         """Handle data update events."""
         logger.debug("SpendingComparisonChart: Data updated")
-        self._update_categories()
+        self._schedule_refresh()
 
     def on_exclusions_changed(self, event: AppEvent) -> None:
         """Handle exclusions change events."""
         logger.debug("SpendingComparisonChart: Exclusions changed")
+        self._schedule_refresh()
+
+    def _refresh_content(self) -> None:
+        """Rebuild the category display."""
         self._update_categories()
 
     def _update_categories(self) -> None:
         """Update the category display with current data."""
         try:
-            data_service = get_data_service()
+            data_service = self._data_service
             exclusions = self.app_state.exclusions
 
+            # Nothing to redraw if neither the data nor the exclusions changed
+            key = (data_service.data_version, frozenset(exclusions))
+            if key == self._last_categories_key:
+                return
+            self._last_categories_key = key
+
             # Get top categories (excluding the excluded ones)
             top_categories = data_service.get_top_categories(
                 limit=5, exclude=exclusions
             )
 
-            # Update display
-            container = self.query_one("#category-container")
-            container.remove_children()
-
             if top_categories:
-                for i, (category, amount, count) in enumerate(top_categories):
-                    bar_width = min(int((amount / top_categories[0][1]) * 20), 20)
-                    bar = "█" * bar_width + "░" * (20 - bar_width)
-
-                    category_display = (
-                        f"{i + 1}. {category:<12} {bar} £{amount:,.2f} ({count} txns)"
+                top_amount = top_categories[0][1]
+                labels = [
+                    Label(
+                        f"{i + 1}. {category:<12} "
+                        f"{generate_bar_chart(amount, top_amount)} "
+                        f"£{amount:,.2f} ({count} txns)",
+                        classes="category-item",
                     )
-                    container.mount(Label(category_display, classes="category-item"))
+                    for i, (category, amount, count) in enumerate(top_categories)
+                ]
             else:
-                container.mount(Label("No data available", classes="no-data"))
+                labels = [Label("No data available", classes="no-data")]
+
+            # Swap every row in together so the list is laid out once
+            container = self._category_container
+            container.remove_children()
+            container.mount_all(labels)
 
         except Exception as e:
-            logger.error(f"Error updating categories: {e}")
-            container = self.query_one("#category-container")
+            logger.error("Error updating categories: %s", e)
+            self._last_categories_key = None
+            container = self._category_container
             container.remove_children()
-            container.mount(Label(f"Error: {e}", classes="error-text"))
+            container.mount_all([Label(f"Error: {e}", classes="error-text")])
 
 
 class PayDayVisualization(StateAwareWidget):
@@ -164,10 +180,11 @@ class PayDayVisualization(StateAwareWidget):
             with Vertical(classes="calendar-info"):
                 with Horizontal():
                     yield Label("Pay Day:", classes="data-label")
-                    payday_label = StatusLabel(classes="data-value")
-                    payday_label.state_key = "pay_day"
-                    payday_label.suffix = " of the month"
-                    yield payday_label
+                    yield StatusLabel(
+                        state_key="pay_day",
+                        suffix=" of the month",
+                        classes="data-value",
+                    )
 
                 yield Label("📅 Calendar Visualization", classes="calendar-placeholder")
                 yield Label("(Pay day highlighting)", classes="calendar-subtitle")
@@ -32,34 +32,35 @@ class DataStatusCard(StateAwareWidget):
                 # Loading status
                 with Horizontal(classes="status-row"):
                     yield Label("Status:", classes="status-label")
-                    loading_label = LoadingLabel(classes="status-value")
-                    loading_label.loading_text = "🔄 Loading..."
-                    loading_label.idle_text = "✅ Ready"
-                    yield loading_label
+                    yield LoadingLabel(
+                        loading_text="🔄 Loading...",
+                        idle_text="✅ Ready",
+                        classes="status-value",
+                    )
 
                 # Transaction count
                 with Horizontal(classes="status-row"):
                     yield Label("Transactions:", classes="status-label")
-                    transactions_label = CounterLabel(classes="status-value")
-                    transactions_label.state_key = "transaction_count"
-                    transactions_label.singular = "record"
-                    transactions_label.plural = "records"
-                    yield transactions_label
+                    yield CounterLabel(
+                        state_key="transaction_count",
+                        singular="record",
+                        plural="records",
+                        classes="status-value",
+                    )
 
                 # Last updated
                 with Horizontal(classes="status-row"):
                     yield Label("Updated:", classes="status-label")
-                    updated_label = TimeLabel(classes="status-value")
-                    updated_label.state_key = "data_last_updated"
-                    yield updated_label
+                    yield TimeLabel(
+                        state_key="data_last_updated", classes="status-value"
+                    )
 
                 # Current balance
                 with Horizontal(classes="status-row"):
                     yield Label("Balance:", classes="status-label")
-                    balance_label = CurrencyLabel(classes="status-value")
-                    balance_label.state_key = "balance"
-                    balance_label.currency_symbol = "£"
-                    yield balance_label
+                    yield CurrencyLabel(
+                        state_key="balance", currency_symbol="£", classes="status-value"
+                    )
 
     def on_mount(self) -> None:
         """Called when widget is mounted."""
@@ -94,37 +95,36 @@ class SettingsStatusCard(StateAwareWidget):
                 # Pay day setting
                 with Horizontal(classes="status-row"):
                     yield Label("Pay Day:", classes="status-label")
-                    payday_label = StatusLabel(classes="status-value")
-                    payday_label.state_key = "pay_day"
-                    payday_label.suffix = " of month"
-                    yield payday_label
+                    yield StatusLabel(
+                        state_key="pay_day", suffix=" of month", classes="status-value"
+                    )
 
                 # Theme setting
                 with Horizontal(classes="status-row"):
                     yield Label("Theme:", classes="status-label")
-                    theme_label = StatusLabel(classes="status-value")
-                    theme_label.state_key = "theme"
-                    yield theme_label
+                    yield StatusLabel(state_key="theme", classes="status-value")
 
                 # Exclusions count
                 with Horizontal(classes="status-row"):
                     yield Label("Exclusions:", classes="status-label")
-                    exclusions_label = CounterLabel(classes="status-value")
-                    exclusions_label.state_key = "exclusions"
-                    exclusions_label.singular = "category"
-                    exclusions_label.plural = "categories"
-                    yield exclusions_label
+                    yield CounterLabel(
+                        state_key="exclusions",
+                        singular="category",
+                        plural="categories",
+                        classes="status-value",
+                    )
 
                 # Configuration status
                 with Horizontal(classes="status-row"):
                     yield Label("Config:", classes="status-label")
-                    config_label = StatusLabel(classes="status-value")
-                    config_label.state_key = "spreadsheet_id"
-                    config_label.status_map = {
-                        None: "❌ Not configured",
-                        "": "❌ Missing ID",
-                    }
-                    yield config_label
+                    yield StatusLabel(
+                        state_key="spreadsheet_id",
+                        status_map={
+                            None: "❌ Not configured",
+                            "": "❌ Missing ID",
+                        },
+                        classes="status-value",
+                    )
 
     def on_mount(self) -> None:
         """Called when widget is mounted."""
@@ -159,42 +159,45 @@ class SystemInfoCard(StateAwareWidget):
                 # Current screen
                 with Horizontal(classes="status-row"):
                     yield Label("Screen:", classes="status-label")
-                    screen_label = StatusLabel(classes="status-value")
-                    screen_label.state_key = "current_screen"
-                    yield screen_label
+                    yield StatusLabel(
+                        state_key="current_screen", classes="status-value"
+                    )
 
                 # Application ready status
                 with Horizontal(classes="status-row"):
                     yield Label("App Status:", classes="status-label")
-                    app_status_label = StatusLabel(classes="status-value")
-                    app_status_label.state_key = "is_ready"
-                    app_status_label.status_map = {
-                        True: "✅ Ready",
-                        False: "🔄 Initializing",
-                    }
-                    yield app_status_label
+                    yield StatusLabel(
+                        state_key="is_ready",
+                        status_map={
+                            True: "✅ Ready",
+                            False: "🔄 Initializing",
+                        },
+                        classes="status-value",
+                    )
 
                 # Refresh status
                 with Horizontal(classes="status-row"):
                     yield Label("Refresh:", classes="status-label")
-                    refresh_label = StatusLabel(classes="status-value")
-                    refresh_label.state_key = "refresh_in_progress"
-                    refresh_label.status_map = {
-                        True: "🔄 In progress",
-                        False: "⏸️ Idle",
-                    }
-                    yield refresh_label
+                    yield StatusLabel(
+                        state_key="refresh_in_progress",
+                        status_map={
+                            True: "🔄 In progress",
+                            False: "⏸️ Idle",
+                        },
+                        classes="status-value",
+                    )
 
                 # Error status
                 with Horizontal(classes="status-row"):
                     yield Label("Errors:", classes="status-label")
-                    error_label = StatusLabel(classes="status-value")
-                    error_label.state_key = "last_error"
-                    error_label.status_map = {
-                        None: "✅ None",
-                        "": "✅ None",
-                    }
-                    yield error_label
+                    yield StatusLabel(
+                        state_key="last_error",
+                        status_map={
+                            None: "✅ None",
+                            "": "✅ None",
+                        },
+                        classes="status-value",
+                    )
 
     def on_mount(self) -> None:
         """Called when widget is mounted."""
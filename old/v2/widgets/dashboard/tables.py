@@ -3,10 +3,10 @@
 import logging
 
 from core import AppEvent
-from core import get_data_service
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.containers import Horizontal
+from textual.coordinate import Coordinate
 from textual.reactive import reactive
 from textual.widgets import DataTable
 from textual.widgets import Label
@@ -16,6 +16,56 @@ from widgets.reactive_label import CounterLabel
 
 logger = logging.getLogger(__name__)
 
+_format_amount = "£{:,.2f}".format
+_format_average = "£{:.2f}".format
+
+
+def _truncate_description(description: str, limit: int = 30) -> str:
+    """Shorten a description to fit the transactions table."""
+    return description[:limit] + "..." if len(description) > limit else description
+
+
+def _ranked_rows(totals: list) -> list:
+    """Build rank/name/amount/count/average rows from (name, amount, count)."""
+    return [
+        [
+            str(rank),
+            name,
+            _format_amount(total_amount),
+            str(count),
+            _format_average(total_amount / count if count > 0 else 0),
+        ]
+        for rank, (name, total_amount, count) in enumerate(totals, 1)
+    ]
+
+
+def _patch_table_rows(table: DataTable, old_rows: list, new_rows: list) -> None:
+    """Bring a table showing old_rows up to date with new_rows.
+
+    Only changed cells are rewritten, and rows are added or removed at the end
+    as the length changes. Rows are keyed by their position.
+    """
+    if table.row_count != len(old_rows):
+        # The table has drifted from old_rows, so rebuild it
+        table.clear()
+        old_rows = []
+
+    common = min(len(old_rows), len(new_rows))
+    for row_index in range(common):
+        old_row, new_row = old_rows[row_index], new_rows[row_index]
+        if old_row == new_row:
+            continue
+        for column_index, (old_cell, new_cell) in enumerate(
+            zip(old_row, new_row, strict=False)
+        ):
+            if old_cell != new_cell:
+                table.update_cell_at(Coordinate(row_index, column_index), new_cell)
+
+    for row_index in range(common, len(new_rows)):
+        table.add_row(*new_rows[row_index], key=str(row_index))
+    for row_index in range(len(new_rows), len(old_rows)):
+        table.remove_row(str(row_index))
+
 
 class TopCategoriesTable(DataWidget):
     """Widget displaying top spending categories in a table format."""
@@ -30,18 +80,20 @@ class TopCategoriesTable(DataWidget):
                     "Showing top categories (excluding filtered):",
                     classes="header-label",
                 )
-                exclusions_label = CounterLabel(classes="exclusion-count")
-                exclusions_label.state_key = "exclusions"
-                exclusions_label.prefix = "("
-                exclusions_label.suffix = " excluded)"
-                exclusions_label.singular = "category"
-                exclusions_label.plural = "categories"
-                yield exclusions_label
+                yield CounterLabel(
+                    state_key="exclusions",
+                    prefix="(",
+                    suffix=" excluded)",
+                    singular="category",
+                    plural="categories",
+                    classes="exclusion-count",
+                )
 
             table = DataTable(id="categories-table", classes="data-table")
             table.add_columns(
                 "Rank", "Category", "Amount", "Transactions", "Avg per Txn"
             )
+            self._table = table
             yield table
 
     def on_mount(self) -> None:
@@ -55,43 +107,35 @@ class TopCategoriesTable(DataWidget):
         """Set up the data query function."""
 
         def get_categories_data():
-            data_service = get_data_service()
+            data_service = self._data_service
             exclusions = self.app_state.exclusions
             top_categories = data_service.get_top_categories(
                 limit=10, exclude=exclusions
             )
 
             # Convert to table rows
-            rows = []
-            for i, (category, total_amount, count) in enumerate(top_categories):
-                avg_amount = total_amount / count if count > 0 else 0
-                rows.append(
-                    [
-                        str(i + 1),
-                        category,
-                        f"£{total_amount:,.2f}",
-                        str(count),
-                        f"£{avg_amount:.2f}",
-                    ]
-                )
-            return rows
+            return _ranked_rows(top_categories)
 
         self.set_query_function(get_categories_data)
 
-    def watch_data(self, data: list) -> None:
+    def _refresh_key(self) -> tuple:
+        """Data version and exclusions that the rows are computed from."""
+        return (
+            self._data_service.data_version,
+            frozenset(self.app_state.exclusions),
+        )
+
+    def watch_data(self, old_data: list, data: list) -> None:
         """React to data changes."""
         try:
-            table = self.query_one("#categories-table")
-            table.clear()
-            for row in data:
-                table.add_row(*row)
+            _patch_table_rows(self._table, old_data, data)
         except Exception as e:
-            logger.error(f"Error updating categories table: {e}")
+            logger.error("Error updating categories table: %s", e)
 
     def on_exclusions_changed(self, event: AppEvent) -> None:
         """Handle exclusions change events."""
         logger.debug("TopCategoriesTable: Exclusions changed, refreshing data")
-        self.refresh_data()
+        self._schedule_refresh()
 
 
 class TopMerchantsTable(DataWidget):
@@ -106,6 +150,7 @@ class TopMerchantsTable(DataWidget):
             table.add_columns(
                 "Rank", "Merchant", "Amount", "Transactions", "Avg per Txn"
             )
+            self._table = table
             yield table
 
     def on_mount(self) -> None:
@@ -119,35 +164,20 @@ class TopMerchantsTable(DataWidget):
         """Set up the data query function."""
 
         def get_merchants_data():
-            data_service = get_data_service()
+            data_service = self._data_service
             top_merchants = data_service.get_top_merchants(limit=10)
 
             # Convert to table rows
-            rows = []
-            for i, (merchant, total_amount, count) in enumerate(top_merchants):
-                avg_amount = total_amount / count if count > 0 else 0
-                rows.append(
-                    [
-                        str(i + 1),
-                        merchant,
-                        f"£{total_amount:,.2f}",
-                        str(count),
-                        f"£{avg_amount:.2f}",
-                    ]
-                )
-            return rows
+            return _ranked_rows(top_merchants)
 
         self.set_query_function(get_merchants_data)
 
-    def watch_data(self, data: list) -> None:
+    def watch_data(self, old_data: list, data: list) -> None:
         """React to data changes."""
         try:
-            table = self.query_one("#merchants-table")
-            table.clear()
-            for row in data:
-                table.add_row(*row)
+            _patch_table_rows(self._table, old_data, data)
         except Exception as e:
-            logger.error(f"Error updating merchants table: {e}")
+            logger.error("Error updating merchants table: %s", e)
 
 
 class LatestTransactionsTable(DataWidget):
@@ -161,16 +191,18 @@ class LatestTransactionsTable(DataWidget):
         with Container(classes="table-container"):
             with Horizontal(classes="table-header"):
                 yield Label("Latest Transactions", classes="table-title")
-                transactions_label = CounterLabel(classes="transaction-count")
-                transactions_label.state_key = "transaction_count"
-                transactions_label.prefix = "(showing "
-                transactions_label.suffix = " of {value} total)"
-                transactions_label.singular = "transaction"
-                transactions_label.plural = "transactions"
-                yield transactions_label
+                yield CounterLabel(
+                    state_key="transaction_count",
+                    prefix="(showing ",
+                    suffix=" of {value} total)",
+                    singular="transaction",
+                    plural="transactions",
+                    classes="transaction-count",
+                )
 
             table = DataTable(id="transactions-table", classes="data-table")
             table.add_columns("Date", "Description", "Category", "Merchant", "Amount")
+            self._table = table
             yield table
 
     def on_mount(self) -> None:
@@ -184,36 +216,29 @@ class LatestTransactionsTable(DataWidget):
         """Set up the data query function."""
 
         def get_transactions_data():
-            data_service = get_data_service()
+            data_service = self._data_service
             transactions = data_service.get_transactions(limit=self.limit)
 
             # Convert to table rows
-            rows = []
-            for transaction in transactions:
-                rows.append(
-                    [
-                        transaction.date.strftime("%Y-%m-%d"),
-                        transaction.description[:30] + "..."
-                        if len(transaction.description) > 30
-                        else transaction.description,
-                        transaction.category,
-                        transaction.merchant,
-                        f"£{transaction.amount:,.2f}",
-                    ]
-                )
-            return rows
+            return [
+                [
+                    transaction.date.date().isoformat(),
+                    _truncate_description(transaction.description),
+                    transaction.category,
+                    transaction.merchant,
+                    _format_amount(transaction.amount),
+                ]
+                for transaction in transactions
+            ]
 
         self.set_query_function(get_transactions_data)
 
-    def watch_data(self, data: list) -> None:
+    def watch_data(self, old_data: list, data: list) -> None:
         """React to data changes."""
         try:
-            table = self.query_one("#transactions-table")
-            table.clear()
-            for row in data:
-                table.add_row(*row)
+            _patch_table_rows(self._table, old_data, data)
         except Exception as e:
-            logger.error(f"Error updating transactions table: {e}")
+            logger.error("Error updating transactions table: %s", e)
 
     def _format_count_label_text(self, total_count: int) -> str:
         """Format the count label text."""
@@ -233,6 +258,7 @@ class CategorySummaryTable(DataWidget):
             table.add_columns(
                 "Category", "Total Spent", "Transactions", "% of Total", "Status"
             )
+            self._table = table
             yield table
 
     def on_mount(self) -> None:
@@ -246,45 +272,44 @@ class CategorySummaryTable(DataWidget):
         """Set up the data query function."""
 
         def get_category_summary_data():
-            data_service = get_data_service()
+            data_service = self._data_service
             exclusions = self.app_state.exclusions
 
             # Get all categories
             all_categories = data_service.get_top_categories(limit=100)
             total_spending = sum(amount for _, amount, _ in all_categories)
+            scale = 100 / total_spending if total_spending > 0 else 0
+            excluded = set(exclusions)
 
             # Convert to table rows
-            rows = []
-            for category, amount, count in all_categories:
-                percentage = (
-                    (amount / total_spending * 100) if total_spending > 0 else 0
-                )
-                status = "🚫 Excluded" if category in exclusions else "✅ Included"
-
-                rows.append(
-                    [
-                        category,
-                        f"£{amount:,.2f}",
-                        str(count),
-                        f"{percentage:.1f}%",
-                        status,
-                    ]
-                )
-            return rows
+            return [
+                [
+                    category,
+                    f"£{amount:,.2f}",
+                    str(count),
+                    f"{amount * scale:.1f}%",
+                    "🚫 Excluded" if category in excluded else "✅ Included",
+                ]
+                for category, amount, count in all_categories
+            ]
 
         self.set_query_function(get_category_summary_data)
 
-    def watch_data(self, data: list) -> None:
+    def _refresh_key(self) -> tuple:
+        """Data version and exclusions that the rows are computed from."""
+        return (
+            self._data_service.data_version,
+            frozenset(self.app_state.exclusions),
+        )
+
+    def watch_data(self, old_data: list, data: list) -> None:
         """React to data changes."""
         try:
-            table = self.query_one("#category-summary-table")
-            table.clear()
-            for row in data:
-                table.add_row(*row)
+            _patch_table_rows(self._table, old_data, data)
         except Exception as e:
-            logger.error(f"Error updating category summary table: {e}")
+            logger.error("Error updating category summary table: %s", e)
 
     def on_exclusions_changed(self, event: AppEvent) -> None:
         """Handle exclusions change events."""
         logger.debug("CategorySummaryTable: Exclusions changed, refreshing data")
-        self.refresh_data()
+        self._schedule_refresh()
@@ -25,6 +25,20 @@ class ReactiveLabel(StateAwareWidget):
     state_key: reactive[str | None] = reactive(None)
     current_value: reactive[Any] = reactive(None)
 
+    def __init__(
+        self,
+        *args: Any,
+        state_key: str | None = None,
+        prefix: str = "",
+        suffix: str = "",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        # Set initial values without running watchers before mount
+        self.set_reactive(ReactiveLabel.state_key, state_key)
+        self.set_reactive(ReactiveLabel.prefix, prefix)
+        self.set_reactive(ReactiveLabel.suffix, suffix)
+
     def compose(self) -> ComposeResult:
         """Compose the widget."""
         self._label = Label()
@@ -139,6 +153,17 @@ class CounterLabel(StateLabel):
     singular: reactive[str] = reactive("item")
     plural: reactive[str] = reactive("items")
 
+    def __init__(
+        self,
+        *args: Any,
+        singular: str = "item",
+        plural: str = "items",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.set_reactive(CounterLabel.singular, singular)
+        self.set_reactive(CounterLabel.plural, plural)
+
     def compose(self) -> ComposeResult:
         """Compose the widget and set up formatter."""
 
@@ -160,6 +185,10 @@ class CurrencyLabel(StateLabel):
     # Reactive property for currency symbol
     currency_symbol: reactive[str] = reactive("£")
 
+    def __init__(self, *args: Any, currency_symbol: str = "£", **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.set_reactive(CurrencyLabel.currency_symbol, currency_symbol)
+
     def compose(self) -> ComposeResult:
         """Compose the widget and set up formatter."""
 
@@ -180,6 +209,13 @@ class StatusLabel(StateLabel):
     # Reactive property for status mapping
     status_map: reactive[dict] = reactive({})
 
+    def __init__(
+        self, *args: Any, status_map: dict | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        if status_map is not None:
+            self.set_reactive(StatusLabel.status_map, status_map)
+
     def compose(self) -> ComposeResult:
         """Compose the widget and set up formatter."""
 
@@ -217,6 +253,17 @@ class LoadingLabel(StateLabel):
     loading_text: reactive[str] = reactive("Loading...")
     idle_text: reactive[str] = reactive("Ready")
 
+    def __init__(
+        self,
+        *args: Any,
+        loading_text: str = "Loading...",
+        idle_text: str = "Ready",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.set_reactive(LoadingLabel.loading_text, loading_text)
+        self.set_reactive(LoadingLabel.idle_text, idle_text)
+
     def on_mount(self) -> None:
         """Called when widget is mounted."""
         # Set default state_key for loading labels
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.screen import Screen
@@ -21,6 +22,9 @@ class DashboardScreen(Screen):
 
     BINDINGS = [("r", "refresh", "Refresh")]
 
+    # Seconds the placeholder refresh takes until there is real data to fetch
+    REFRESH_DELAY = 5.0
+
     def compose(self) -> ComposeResult:
         """Compose the dashboard screen."""
         logger.debug("Composing the dashboard screen")
@@ -31,12 +35,13 @@ class DashboardScreen(Screen):
     def on_mount(self):
         """Mount the dashboard screen."""
         logger.debug("Mounting the dashboard screen")
-        logger.debug(f"{self.app.screen_stack=}")
+        logger.debug("self.app.screen_stack=%r", self.app.screen_stack)
 
+    @work(exclusive=True, group="dashboard-refresh")
     async def action_refresh(self):
-        """Refresh the dashboard screen."""
+        """Refresh the dashboard screen, superseding any refresh in progress."""
         logger.debug("Refreshing the dashboard screen")
         label = self.query_one(ReactiveLabel)
         label.set_updating()
-        await asyncio.sleep(5)
+        await asyncio.sleep(self.REFRESH_DELAY)
         label.stop_updating()
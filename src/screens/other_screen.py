@@ -27,4 +27,4 @@ class OtherScreen(Screen):
     def on_mount(self):
         """Mount the other screen."""
         logger.debug("Mounting the other screen")
-        logger.debug(f"{self.app.screen_stack=}")
+        logger.debug("self.app.screen_stack=%r", self.app.screen_stack)
@@ -1,25 +1,38 @@
 import asyncio
 import pytest
+import pytest_asyncio
 
+from textual import work
 from textual.app import App, ComposeResult
 from widgets import ReactiveLabel
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_app() -> App:
     class TestApp(App):
         BINDINGS = [("r", "refresh", "Refresh")]
 
+        # Seconds the simulated refresh takes; kept short for tests
+        refresh_delay: float = 0.1
+
         def compose(self) -> ComposeResult:
             yield ReactiveLabel(id="test-label")
 
+        @work(exclusive=True)
         async def action_refresh(self):
             """Refresh the dashboard screen."""
             label = self.query_one(ReactiveLabel)
             label.set_updating()
-            await asyncio.sleep(5)
+            await asyncio.sleep(self.refresh_delay)
             label.stop_updating()
 
     app = TestApp()
 
     return app
+
+
+@pytest_asyncio.fixture(scope="module")
+async def test_pilot(test_app: App):
+    """Run the module's test app once and share its pilot between tests."""
+    async with test_app.run_test() as pilot:
+        yield pilot
@@ -1,16 +1,24 @@
+import asyncio
+
 import pytest
 
-from textual.app import App
+from textual.pilot import Pilot
 from widgets import ReactiveLabel
 
 
+@pytest.fixture(autouse=True)
+def reset_label(test_pilot: Pilot):
+    """Return the shared label to its idle state before each test."""
+    test_pilot.app.query_one(ReactiveLabel).stop_updating()
+
+
 @pytest.mark.asyncio
-async def test_label_updating(test_app: App):
+async def test_label_updating(test_pilot: Pilot):
     """Test that the label updates correctly."""
-    async with test_app.run_test() as pilot:
-        await pilot.press("r")
-        await pilot.pause(1)
-        label = pilot.app.query_one(ReactiveLabel)
-        assert label.has_class("loading-label")
-        # pilot.pause(5)
-        # assert not label.has_class("loading-label")
+    pilot = test_pilot
+    label = pilot.app.query_one(ReactiveLabel)
+    await pilot.press("r")
+    await asyncio.wait_for(label._updating_event.wait(), 1.0)
+    assert label.has_class("loading-label")
+    await pilot.app.workers.wait_for_complete()
+    assert not label.has_class("loading-label")
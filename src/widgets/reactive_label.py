@@ -1,6 +1,8 @@
 """Module containing ReactiveLabel widget."""
 
+import asyncio
 import logging
+from typing import Any
 
 from textual.message import Message
 from textual.reactive import reactive
@@ -16,6 +18,11 @@ class ReactiveLabel(Label):
 
     is_updating = reactive(False)
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Set while the label is updating, so callers can await the change
+        self._updating_event = asyncio.Event()
+
     async def watch_is_updating(self, is_updating: bool) -> None:
         if is_updating:
             self.update("🔄 Loading...")
@@ -28,6 +35,7 @@ class ReactiveLabel(Label):
     def set_updating(self) -> None:
         self.is_updating = True
         self.add_class("loading-label")
+        self._updating_event.set()
         self.post_message(self.IsUpdating())
 
     class UpdateComplete(Message):
@@ -35,5 +43,6 @@ class ReactiveLabel(Label):
 
     def stop_updating(self) -> None:
         self.is_updating = False
+        self._updating_event.clear()
         self.post_message(self.UpdateComplete())
         self.remove_class("loading-label")